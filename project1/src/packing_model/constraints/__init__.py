@@ -3,6 +3,11 @@ Constraints Module
 
 This module organizes all constraint definitions into logical categories.
 Each category is defined in its own sub-module for easy extension.
+
+The sets (model.ORDERS, model.TIME, ...) index the constraints, but the
+loops inside rule bodies run over plain ranges (I, J, T, W): those loops
+run once per generated row, and iterating a range is several times faster
+than iterating the equivalent RangeSet.
 """
 
 from .assignment import add_assignment_constraints
@@ -17,6 +17,10 @@ def add_assignment_constraints(model, data):
         data: Dictionary containing problem data
     """
 
+    # Index ranges for the rule bodies
+    J = range(1, int(data['n_lines']) + 1)
+    W = range(1, int(data['n_workers']) + 1)
+
     # Constraint: Each order assigned to exactly one line, one time, and one worker
     def one_assignment_rule(m, i):
         """
@@ -27,9 +31,9 @@ def add_assignment_constraints(model, data):
         """
         return sum(
             m.x[i, j, t, w]
-            for j in m.LINES
-            for t in m.TIME
-            for w in m.WORKERS
+            for j in J
+            for t in m.start_slots[i, j]
+            for w in W
         ) == 1
 
     model.one_assignment = pyo.Constraint(
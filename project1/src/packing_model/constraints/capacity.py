@@ -7,6 +7,8 @@ of orders on the same line and respecting capacity reservations.
 
 import pyomo.environ as pyo
 
+from ..variables import running_starts
+
 
 def add_capacity_constraints(model, data):
     """
@@ -17,6 +19,11 @@ def add_capacity_constraints(model, data):
         data: Dictionary containing problem data
     """
 
+    # Index ranges for the rule bodies
+    I = range(1, int(data['n_orders']) + 1)
+    J = range(1, int(data['n_lines']) + 1)
+    W = range(1, int(data['n_workers']) + 1)
+
     # Constraint: No overlap of orders on the same line
     def line_capacity_rule(m, j, tau):
         """
@@ -26,14 +33,12 @@ def add_capacity_constraints(model, data):
         is being processed. An order starting at time t is processing
         at time tau if t <= tau < t + processing_time.
         """
-        expr = 0
-        for i in m.ORDERS:
-            for w in m.WORKERS:
-                for t in m.TIME:
-                    # Check if order starting at t would be processing at tau
-                    if t <= tau < t + int(m.p[i, j]):
-                        expr += m.x[i, j, t, w]
-        return expr <= m.u[j]
+        return sum(
+            m.x[i, j, t, w]
+            for i in I
+            for t in running_starts(m, i, j, tau)
+            for w in W
+        ) <= m.u[j]
 
     model.line_capacity = pyo.Constraint(
         model.LINES, model.TIME,
@@ -52,10 +57,10 @@ def add_capacity_constraints(model, data):
         """
         total_usage = sum(
             m.x[i, j, t, w] * m.p[i, j]
-            for i in m.ORDERS
-            for j in m.LINES
-            for t in m.TIME
-            for w in m.WORKERS
+            for i in I
+            for j in J
+            for t in m.start_slots[i, j]
+            for w in W
         )
         total_capacity = (1 - m.alpha) * data['n_lines'] * data['n_timeslots']
         return total_usage <= total_capacity
@@ -75,9 +80,9 @@ def add_capacity_constraints(model, data):
         """
         return sum(
             m.x[i, j, t, w]
-            for i in m.ORDERS
-            for t in m.TIME
-            for w in m.WORKERS
+            for i in I
+            for t in m.start_slots[i, j]
+            for w in W
         ) <= m.u[j] * data['n_orders'] * data['n_timeslots']
 
     model.line_in_use = pyo.Constraint(
@@ -96,9 +101,9 @@ def add_capacity_constraints(model, data):
         """
         return m.u[j] <= sum(
             m.x[i, j, t, w]
-            for i in m.ORDERS
-            for t in m.TIME
-            for w in m.WORKERS
+            for i in I
+            for t in m.start_slots[i, j]
+            for w in W
         )
 
     model.line_in_use_lower = pyo.Constraint(
@@ -17,6 +17,10 @@ def add_otif_constraints(model, data):
         data: Dictionary containing problem data
     """
 
+    # Index ranges for the rule bodies
+    J = range(1, int(data['n_lines']) + 1)
+    W = range(1, int(data['n_workers']) + 1)
+
     # Constraint: Calculate start time for each order
     def start_time_rule(m, i):
         """
@@ -27,9 +31,9 @@ def add_otif_constraints(model, data):
         """
         return m.time_start[i] == sum(
             t * m.x[i, j, t, w]
-            for j in m.LINES
-            for w in m.WORKERS
-            for t in m.TIME
+            for j in J
+            for w in W
+            for t in m.start_slots[i, j]
         )
 
     model.start_time = pyo.Constraint(
@@ -47,9 +51,9 @@ def add_otif_constraints(model, data):
         """
         return m.time_completion[i] == sum(
             (t + m.p[i, j]) * m.x[i, j, t, w]
-            for j in m.LINES
-            for w in m.WORKERS
-            for t in m.TIME
+            for j in J
+            for w in W
+            for t in m.start_slots[i, j]
         )
 
     model.completion_time = pyo.Constraint(
@@ -17,10 +17,13 @@ def add_shipping_constraints(model, data):
         data: Dictionary containing problem data
     """
 
+    # Index ranges for the rule bodies
+    T = range(1, int(data['n_timeslots']) + 1)
+
     # Constraint: Each order ships exactly once
     def ship_once_rule(m, i):
         """Each order must ship exactly once across all time slots."""
-        return sum(m.ship[i, t] for t in m.TIME) == 1
+        return pyo.quicksum(m.ship[i, t] for t in T) == 1
 
     model.ship_once = pyo.Constraint(
         model.ORDERS,
@@ -28,10 +31,39 @@ def add_shipping_constraints(model, data):
         doc="Each order ships exactly once"
     )
 
+    # SOS1: Shipping slots of each order (opt-in)
+    # Solvers with native SOS branching (Gurobi, CPLEX) can branch on the
+    # whole slot set of an order instead of on single ship[i,t] binaries.
+    # ship_once is kept, since SOS1 alone only means "at most one slot".
+    # HiGHS rejects SOS constraints, hence the data flag.
+    if data.get('ship_sos1', False):
+        def ship_sos_rule(m, i):
+            """Shipping slots of order i, weighted by their time."""
+            return [m.ship[i, t] for t in T], list(T)
+
+        model.ship_sos = pyo.SOSConstraint(
+            model.ORDERS,
+            rule=ship_sos_rule,
+            sos=1,
+            doc="At most one shipping slot per order (SOS1)"
+        )
+
+    # Fixed: No shipping before the earliest possible completion
+    # Every order is assigned, and its completion time t + p(i,j) is at
+    # least 1 + min_j p(i,j), so ship_after_completion rules out earlier
+    # slots. Fixing them removes the columns at build time instead of
+    # leaving them to presolve.
+    for i in model.ORDERS:
+        earliest = 1 + min(int(model.p[i, j]) for j in model.LINES)
+        for t in model.TIME:
+            if t >= earliest:
+                break
+            model.ship[i, t].fix(0)
+
     # Constraint: Calculate shipping time
     def shipping_time_rule(m, i):
         """Calculate when order i ships."""
-        return m.time_ship[i] == sum(t * m.ship[i, t] for t in m.TIME)
+        return m.time_ship[i] == pyo.quicksum(t * m.ship[i, t] for t in T)
 
     model.shipping_time_calc = pyo.Constraint(
         model.ORDERS,
@@ -50,58 +82,32 @@ def add_shipping_constraints(model, data):
         doc="Cannot ship before order completion"
     )
 
-    # Big-M for indicator constraints
-    BIG_M = data['n_timeslots'] * 1000  # Large enough constant
-
-    # Constraint: Determine if ship is early
-    def ship_early_indicator_1(m, i):
-        """Force ship_early = 1 if time_ship < due date."""
-        return m.time_ship[i] <= m.due[i] + BIG_M * (1 - m.ship_early[i])
-
-    model.ship_early_ind_1 = pyo.Constraint(
+    # Early/late shipping status
+    # Since each order ships in exactly one slot, the status is a partial
+    # sum of ship[i,t] over the slots before/after the due date. Declared as
+    # expressions, so no binaries or big-M rows are needed.
+    model.ship_early = pyo.Expression(
         model.ORDERS,
-        rule=ship_early_indicator_1,
-        doc="Ship early indicator part 1"
+        rule=ship_early_rule,
+        doc="Order i ships before due date"
     )
 
-    def ship_early_indicator_2(m, i):
-        """Force ship_early = 0 if time_ship >= due date."""
-        return m.time_ship[i] >= m.due[i] - BIG_M * m.ship_early[i]
-
-    model.ship_early_ind_2 = pyo.Constraint(
+    model.ship_late = pyo.Expression(
         model.ORDERS,
-        rule=ship_early_indicator_2,
-        doc="Ship early indicator part 2"
+        rule=ship_late_rule,
+        doc="Order i ships after due date"
     )
 
-    # Constraint: Determine if ship is late
-    def ship_late_indicator_1(m, i):
-        """Force ship_late = 1 if time_ship > due date."""
-        return m.time_ship[i] >= m.due[i] + 1 - BIG_M * (1 - m.ship_late[i])
 
-    model.ship_late_ind_1 = pyo.Constraint(
-        model.ORDERS,
-        rule=ship_late_indicator_1,
-        doc="Ship late indicator part 1"
-    )
+# The early/late rules are module level so PackingScheduleModel.reset_data()
+# can rebuild the expressions when the (mutable) due dates change.
+def ship_early_rule(m, i):
+    """Order i ships before its due date (1) or not (0)."""
+    due = pyo.value(m.due[i])
+    return pyo.quicksum(m.ship[i, t] for t in range(1, len(m.TIME) + 1) if t < due)
 
-    def ship_late_indicator_2(m, i):
-        """Force ship_late = 0 if time_ship <= due date."""
-        return m.time_ship[i] <= m.due[i] + BIG_M * m.ship_late[i]
 
-    model.ship_late_ind_2 = pyo.Constraint(
-        model.ORDERS,
-        rule=ship_late_indicator_2,
-        doc="Ship late indicator part 2"
-    )
-
-    # Constraint: Order is either early, on-time, or late
-    def ship_timing_status_rule(m, i):
-        """Order must be classified as early, on-time, or late."""
-        return m.ship_early[i] + m.ship_late[i] <= 1
-
-    model.ship_timing_status = pyo.Constraint(
-        model.ORDERS,
-        rule=ship_timing_status_rule,
-        doc="Order timing classification"
-    )
+def ship_late_rule(m, i):
+    """Order i ships after its due date (1) or not (0)."""
+    due = pyo.value(m.due[i])
+    return pyo.quicksum(m.ship[i, t] for t in range(1, len(m.TIME) + 1) if t > due)
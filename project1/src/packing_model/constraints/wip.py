@@ -7,6 +7,8 @@ including production, inventory, and flow times.
 
 import pyomo.environ as pyo
 
+from ..variables import add_var, running_starts
+
 
 def add_wip_constraints(model, data):
     """
@@ -17,23 +19,35 @@ def add_wip_constraints(model, data):
         data: Dictionary containing problem data
     """
 
-    # Constraint: Flow time calculation (UPDATED for Problem 2)
+    # Index ranges for the rule bodies
+    I = range(1, int(data['n_orders']) + 1)
+    J = range(1, int(data['n_lines']) + 1)
+    W = range(1, int(data['n_workers']) + 1)
+
+    # Expression: Flow time calculation (UPDATED for Problem 2)
     def flow_time_rule(m, i):
         """
         Calculate flow time from start to shipping.
 
         Flow time = shipping time - start time
         Note: time_ship is now a decision variable (not parameter)
+
+        Defined as an expression rather than a variable plus an equality
+        constraint, so it adds no column or row to the model.
         """
-        return m.time_flow[i] == m.time_ship[i] - m.time_start[i]
+        return m.time_ship[i] - m.time_start[i]
 
-    model.flow_time = pyo.Constraint(
+    model.time_flow = pyo.Expression(
         model.ORDERS,
         rule=flow_time_rule,
-        doc="Calculate flow time for each order"
+        doc="Flow time (start to shipping) for each order"
     )
 
     # Constraint: Production completion
+    # Processing times read once; the start slot that completes at t on
+    # line j is t - p(i,j), so each rule looks up one slot per line.
+    p = {(i, j): int(model.p[i, j]) for i in model.ORDERS for j in model.LINES}
+
     def production_rule(m, i, t):
         """
         Determine when production is completed.
@@ -41,15 +55,16 @@ def add_wip_constraints(model, data):
         Order i is produced at time t if it started at time (t - processing_time)
         on some line.
         """
-        expr = 0
-        for j in m.LINES:
-            for w in m.WORKERS:
-                p_time = int(m.p[i, j])
-                if t >= p_time:  # Need at least p_time slots
-                    start_time = t - p_time
-                    if start_time >= 1:
-                        expr += m.x[i, j, start_time, w]
-        return m.prod[i, t] == expr
+        completing = [
+            (j, t - p[i, j])
+            for j in J
+            if t - p[i, j] in m.start_slots[i, j]
+        ]
+        return m.prod[i, t] == sum(
+            m.x[i, j, start_time, w]
+            for j, start_time in completing
+            for w in W
+        )
 
     model.production = pyo.Constraint(
         model.ORDERS, model.TIME,
@@ -78,17 +93,47 @@ def add_wip_constraints(model, data):
         Inventory balance for subsequent time periods.
 
         inv[i,t] = inv[i,t-1] + production - shipments
+
+        Indexed over t = 2..T only; t = 1 is inventory_balance_first.
         """
-        if t == 1:
-            return pyo.Constraint.Skip
         return m.inv[i, t] == m.inv[i, t-1] + m.prod[i, t] - m.ship[i, t]
 
     model.inventory_balance = pyo.Constraint(
-        model.ORDERS, model.TIME,
+        model.ORDERS, range(2, int(data['n_timeslots']) + 1),
         rule=inventory_balance_rule,
         doc="Inventory balance equation"
     )
 
+    # WIP window: order i can only be in process or in stock from its
+    # earliest start on, unless it has initial inventory. The indicator is
+    # created here, together with its defining constraints, and only for
+    # (i, t) pairs inside that window.
+    def in_wip_window(m, i, t):
+        """Order i can be processing or in inventory at time t."""
+        if m.inv0[i] > 0:
+            return True
+        return any(
+            len(m.start_slots[i, j]) > 0 and m.start_slots[i, j][0] <= t
+            for j in J
+        )
+
+    model.WIP_INDEX = pyo.Set(
+        dimen=2,
+        initialize=[
+            (i, t)
+            for i in model.ORDERS
+            for t in model.TIME
+            if in_wip_window(model, i, t)
+        ],
+        doc="(order, time) pairs inside the order's WIP window"
+    )
+
+    add_var(
+        model, 'wip_indicator', model.WIP_INDEX,
+        domain=pyo.Binary,
+        doc="Order i is in process at time t"
+    )
+
     # Constraint: WIP indicator
     def wip_indicator_rule(m, i, t):
         """
@@ -98,19 +143,19 @@ def add_wip_constraints(model, data):
         - It's currently being processed, OR
         - It's in inventory (produced but not yet shipped)
         """
-        expr = 0
-        for j in m.LINES:
-            for w in m.WORKERS:
-                for tau in m.TIME:
-                    # Order started at tau and is still processing at t
-                    if tau <= t < tau + int(m.p[i, j]):
-                        expr += m.x[i, j, tau, w]
+        # Order started at tau and is still processing at t
+        expr = sum(
+            m.x[i, j, tau, w]
+            for j in J
+            for tau in running_starts(m, i, j, t)
+            for w in W
+        )
 
         # WIP indicator <= (processing indicator + inventory)
         return m.wip_indicator[i, t] <= expr + m.inv[i, t]
 
     model.wip_indicator_calc = pyo.Constraint(
-        model.ORDERS, model.TIME,
+        model.WIP_INDEX,
         rule=wip_indicator_rule,
         doc="WIP indicator calculation"
     )
@@ -122,7 +167,9 @@ def add_wip_constraints(model, data):
 
         Sum WIP indicators across all orders.
         """
-        return m.wip[t] == sum(m.wip_indicator[i, t] for i in m.ORDERS)
+        return m.wip[t] == sum(
+            m.wip_indicator[i, t] for i in I if (i, t) in m.WIP_INDEX
+        )
 
     model.wip_count = pyo.Constraint(
         model.TIME,
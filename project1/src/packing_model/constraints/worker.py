@@ -16,22 +16,37 @@ def add_worker_constraints(model, data):
         data: Dictionary containing problem data
     """
 
+    # Index ranges for the rule bodies
+    I = range(1, int(data['n_orders']) + 1)
+    T = range(1, int(data['n_timeslots']) + 1)
+    W = range(1, int(data['n_workers']) + 1)
+
+    # (order, line, start) triples running at each time slot, shared by all
+    # workers
+    running = model.running_by_slot
+
+    # No order can be running in a slot with an empty bucket, so nobody
+    # works there: fix the indicators instead of adding 0 == w_working rows
+    for tau, bucket in running.items():
+        if not bucket:
+            for w in model.WORKERS:
+                model.w_working[w, tau].fix(0)
+
     # Constraint: Worker working indicator
     def worker_working_rule(m, w, tau):
         """
         Link worker working indicator to order assignments.
 
         Worker w is working at time tau if they're assigned to an order
-        that is being processed at time tau.
+        that is being processed at time tau. Skipped for slots where no
+        order can be running (w_working is fixed to 0 there).
         """
-        expr = 0
-        for i in m.ORDERS:
-            for j in m.LINES:
-                for t in m.TIME:
-                    # Check if order starting at t is being processed at tau
-                    if t <= tau < t + int(m.p[i, j]):
-                        expr += m.x[i, j, t, w]
-        return expr == m.w_working[w, tau]
+        if not running[tau]:
+            return pyo.Constraint.Skip
+        return sum(
+            m.x[i, j, t, w]
+            for (i, j, t) in running[tau]
+        ) == m.w_working[w, tau]
 
     model.worker_working = pyo.Constraint(
         model.WORKERS, model.TIME,
@@ -64,13 +79,13 @@ def add_worker_constraints(model, data):
         """
         total_used = sum(
             m.w_working[w, t]
-            for w in m.WORKERS
-            for t in m.TIME
+            for w in W
+            for t in T
         )
         total_available = sum(
             m.a[w, t]
-            for w in m.WORKERS
-            for t in m.TIME
+            for w in W
+            for t in T
         )
         return total_used <= (1 - m.alpha) * total_available
 
@@ -94,10 +109,12 @@ def add_worker_constraints(model, data):
             # No movement at first time slot (no previous state)
             return pyo.Constraint.Skip
 
-        # Sum of differences for this line
+        # Sum of differences for this line (starts outside the feasible
+        # start slots don't exist and count as zero)
         expr = sum(
-            m.x[i, j, t, w] - m.x[i, j, t-1, w]
-            for i in m.ORDERS
+            m.x[i, j, t, w] for i in I if t in m.start_slots[i, j]
+        ) - sum(
+            m.x[i, j, t-1, w] for i in I if t-1 in m.start_slots[i, j]
         )
 
         return m.m[w, t] >= expr
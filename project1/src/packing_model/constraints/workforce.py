@@ -17,14 +17,26 @@ def add_workforce_constraints(model, data):
         data: Dictionary containing problem data
     """
 
+    # Index ranges for the rule bodies
+    W = range(1, int(data['n_workers']) + 1)
+
+    # Nobody works in a slot where no order can be running (w_working is
+    # fixed to 0 there), so workers_used is fixed too and needs no row
+    for t, bucket in model.running_by_slot.items():
+        if not bucket:
+            model.workers_used[t].fix(0)
+
     # Constraint: Calculate total workers used at each time
     def workers_used_rule(m, t):
         """
         Calculate total workers active at time t.
 
-        Sum the working indicator across all workers.
+        Sum the working indicator across all workers. Skipped for slots
+        where no order can be running.
         """
-        return m.workers_used[t] == sum(m.w_working[w, t] for w in m.WORKERS)
+        if not m.running_by_slot[t]:
+            return pyo.Constraint.Skip
+        return m.workers_used[t] == pyo.quicksum(m.w_working[w, t] for w in W)
 
     model.workers_used_calc = pyo.Constraint(
         model.TIME,
@@ -89,35 +101,36 @@ def add_workforce_constraints(model, data):
         Calculate workforce change between consecutive periods.
 
         workers_used[t] = workers_used[t-1] + increase - decrease
+
+        Indexed over t = 2..T only, there is no change into the first period.
         """
-        if t == 1:
-            return pyo.Constraint.Skip
         return (
             m.workers_used[t] ==
             m.workers_used[t-1] + m.workforce_increase[t] - m.workforce_decrease[t]
         )
 
     model.workforce_change_calc = pyo.Constraint(
-        model.TIME,
+        range(2, int(data['n_timeslots']) + 1),
         rule=workforce_change_rule,
         doc="Workforce change calculation"
     )
 
-    # Constraint: Total workforce change (absolute value)
+    # Expression: Total workforce change (absolute value)
     def workforce_change_total_rule(m, t):
         """
         Calculate total absolute workforce change.
 
         workforce_change = increase + decrease
 
-        This gives the absolute value of change between periods.
+        This gives the absolute value of change between periods. It is an
+        expression over the increase/decrease split, not a separate variable.
         """
         if t == 1:
-            return pyo.Constraint.Skip
-        return m.workforce_change[t] == m.workforce_increase[t] + m.workforce_decrease[t]
+            return 0
+        return m.workforce_increase[t] + m.workforce_decrease[t]
 
-    model.workforce_change_total = pyo.Constraint(
+    model.workforce_change = pyo.Expression(
         model.TIME,
         rule=workforce_change_total_rule,
-        doc="Total absolute workforce change"
+        doc="Absolute change in workforce from t-1 to t"
     )
@@ -5,13 +5,16 @@ This module provides the main PackingScheduleModel class that coordinates
 all components of the optimization model.
 """
 
+import warnings
+
 import pyomo.environ as pyo
 from pyomo.opt import SolverFactory
 import numpy as np
 
-from .parameters import add_parameters
+from .parameters import ParameterManager, add_parameters
 from .variables import add_variables
 from .constraints import add_all_constraints
+from .constraints.shipping import ship_early_rule, ship_late_rule
 from .objective import add_objective
 
 
@@ -51,10 +54,19 @@ class PackingScheduleModel:
                 - priority: Priority weight vector [i]
                 - workforce_target: Target workforce level
                 - objective_weights: Dict with keys alpha, beta, gamma, delta
+                Optional keys:
+                - ship_sos1: Declare shipping slots as SOS1 sets (for solvers
+                  with SOS support, e.g. Gurobi/CPLEX; not HiGHS, where
+                  solve('appsi_highs') raises NotImplementedError)
         """
         self.data = data
         self.model = pyo.ConcreteModel(name="Packing_Schedule_Optimization")
 
+        # Persistent APPSI solver, created on the first solve()
+        self._solver = None
+        self._solver_name = None
+        self._solver_options = None
+
         # Build model components in order
         self._define_sets()
         add_parameters(self.model, data)
@@ -62,6 +74,57 @@ class PackingScheduleModel:
         add_all_constraints(self.model, data)
         add_objective(self.model, data)
 
+    def reset_data(self, new_data):
+        """
+        Swap in new due dates, priorities, reserved capacity and workforce target.
+
+        These enter the model as coefficients, constants and bounds, so they
+        are mutable Params and are updated in place. Constraints and the
+        objective are not rebuilt; only the early/late shipping expressions
+        and the lateness/earliness bounds are refreshed for new due dates.
+        Every other key shapes the model itself (processing times decide the
+        start slots, initial inventory decides the WIP window) and must be
+        unchanged; build a new PackingScheduleModel for those.
+
+        Args:
+            new_data (dict): Problem data with the same keys as the constructor
+
+        Raises:
+            ValueError: If a key other than due_date, priority,
+                reserved_capacity or workforce_target differs from the
+                current data
+        """
+        mutable_keys = ('due_date', 'priority', 'reserved_capacity', 'workforce_target')
+        for key, value in self.data.items():
+            if key in mutable_keys or key not in new_data:
+                continue
+            if isinstance(value, dict):
+                changed = value != new_data[key]
+            else:
+                changed = not np.array_equal(np.asarray(value), np.asarray(new_data[key]))
+            if changed:
+                raise ValueError(f"'{key}' changes the model structure; build a new model instead")
+
+        m = self.model
+        m.priority.store_values(ParameterManager._initializer(new_data['priority']))
+        m.alpha.set_value(new_data['reserved_capacity'])
+        m.workforce_target.set_value(new_data['workforce_target'])
+        for t in m.TIME:
+            m.deviation_below[t].setub(new_data['workforce_target'])
+
+        # Due dates: same bounds as VariableManager._define_otif_variables
+        due_date = new_data['due_date']
+        m.due.store_values(ParameterManager._initializer(due_date))
+        max_lateness = max(0, new_data['n_timeslots'] - min(due_date))
+        max_earliness = max(0, max(due_date) - 1)
+        for i in m.ORDERS:
+            m.lateness[i].setub(max_lateness)
+            m.early[i].setub(max_earliness)
+            m.ship_early[i].set_value(ship_early_rule(m, i))
+            m.ship_late[i].set_value(ship_late_rule(m, i))
+
+        self.data = new_data
+
     def _define_sets(self):
         """
         Define all index sets for the model.
@@ -71,12 +134,15 @@ class PackingScheduleModel:
         model = self.model
 
         # Primary index sets
-        model.ORDERS = pyo.RangeSet(1, self.data['n_orders'])
-        model.LINES = pyo.RangeSet(1, self.data['n_lines'])
-        model.TIME = pyo.RangeSet(1, self.data['n_timeslots'])
-        model.WORKERS = pyo.RangeSet(1, self.data['n_workers'])
-
-    def solve(self, solver_name='appsi_highs', tee=True, **solver_options):
+        # RangeSets are stored as bounds only (no per-element objects). The
+        # dimensions are cast to int so numpy integers from generated data
+        # don't leak into the bounds and every membership/product iteration.
+        model.ORDERS = pyo.RangeSet(1, int(self.data['n_orders']))
+        model.LINES = pyo.RangeSet(1, int(self.data['n_lines']))
+        model.TIME = pyo.RangeSet(1, int(self.data['n_timeslots']))
+        model.WORKERS = pyo.RangeSet(1, int(self.data['n_workers']))
+
+    def solve(self, solver_name='appsi_highs', tee=True, warmstart=False, **solver_options):
         """
         Solve the optimization model.
 
@@ -84,7 +150,11 @@ class PackingScheduleModel:
             solver_name (str): Name of the solver to use
                 Options: 'appsi_highs', 'highs', 'gurobi', 'cplex', 'glpk'
             tee (bool): If True, display solver output
+            warmstart (bool): Pass the current variable values as a MIP start
+                (e.g. from set_start_from_relaxation()). Solvers that cannot
+                take a start (e.g. glpk) solve without it and warn
             **solver_options: Additional options to pass to the solver
+                (applied to this call only)
                 Examples:
                 - time_limit: Time limit in seconds
                 - mip_rel_gap: Relative MIP gap tolerance
@@ -97,16 +167,44 @@ class PackingScheduleModel:
                 - objective_value: Objective function value (if optimal)
                 - solve_time: Time taken to solve
         """
-        # Create solver instance
-        solver = SolverFactory(solver_name)
+        # APPSI solvers are persistent: the instance is kept and reused, so a
+        # repeated solve (e.g. after reset_data()) only pushes the changed
+        # parameters and bounds instead of rebuilding the whole model. The
+        # solver keeps options once set, so the instance is only reused
+        # while the options match those of the previous call.
+        if solver_name.startswith('appsi_'):
+            if (self._solver is None or self._solver_name != solver_name
+                    or self._solver_options != solver_options):
+                self._solver = SolverFactory(solver_name)
+                self._solver_name = solver_name
+                self._solver_options = dict(solver_options)
+            solver = self._solver
+        else:
+            solver = SolverFactory(solver_name)
 
-        # Set solver options
+        # Set solver options. The options container is cleared in place
+        # rather than replaced, since shell solvers (gurobi, cplex) read it
+        # as a Bunch
+        solver.options.clear()
         for key, value in solver_options.items():
             solver.options[key] = value
 
-        # Solve the model
+        # Solve the model (numeric labels: no per-index names are generated)
         print("Starting optimization...")
-        results = solver.solve(self.model, tee=tee)
+        # Only solvers that can take a MIP start accept the warmstart keyword;
+        # for the others (e.g. glpk) it would reach the LP writer and fail
+        solve_kwargs = {}
+        if warmstart:
+            if solver.warm_start_capable():
+                solve_kwargs['warmstart'] = True
+            else:
+                warnings.warn(
+                    f"Solver '{solver_name}' does not support warm starts; "
+                    f"solving without the start values"
+                )
+        results = solver.solve(
+            self.model, tee=tee, symbolic_solver_labels=False, **solve_kwargs
+        )
 
         # Package results
         solution_info = {
@@ -126,6 +224,44 @@ class PackingScheduleModel:
 
         return solution_info
 
+    def set_start_from_relaxation(self, solver_name='appsi_highs'):
+        """
+        Set rounded LP-relaxation values as the starting point of the MIP.
+
+        A copy of the model with all integer variables relaxed is solved,
+        and its assignment (x) and shipping (ship) values are rounded onto
+        this model. The rounded point need not be feasible; solvers use it
+        as a hint and repair or discard it. Call solve(warmstart=True)
+        afterwards.
+
+        Args:
+            solver_name (str): Solver for the LP relaxation
+
+        Returns:
+            bool: True if the relaxation was solved and values were set
+        """
+        relaxed = self.model.clone()
+        pyo.TransformationFactory('core.relax_integer_vars').apply_to(relaxed)
+
+        results = SolverFactory(solver_name).solve(
+            relaxed, symbolic_solver_labels=False, load_solutions=False
+        )
+        if results.solver.termination_condition != pyo.TerminationCondition.optimal:
+            return False
+        relaxed.solutions.load_from(results)
+
+        # One bulk set_values() call per variable instead of per-index
+        # set_value() calls
+        for name in ('x', 'ship'):
+            relaxed_var = relaxed.component(name)
+            var = self.model.component(name)
+            var.set_values({
+                index: round(relaxed_var[index].value or 0)
+                for index, v in var.items() if not v.fixed
+            })
+
+        return True
+
     def get_solution(self):
         """
         Extract solution values from the solved model.
@@ -149,48 +285,54 @@ class PackingScheduleModel:
         }
 
         # Extract assignment decisions
-        for i in model.ORDERS:
-            for j in model.LINES:
-                for t in model.TIME:
-                    for w in model.WORKERS:
-                        if pyo.value(model.x[i, j, t, w]) > 0.5:
-                            solution['assignments'].append({
-                                'order': i,
-                                'line': j,
-                                'time': t,
-                                'worker': w,
-                                'start': pyo.value(model.time_start[i]),
-                                'completion': pyo.value(model.time_completion[i])
-                            })
+        # X_INDEX is sparse, so the values are fetched into one flat array
+        # (.value is a plain attribute read, no expression walk) and only
+        # the few selected indices are visited in Python.
+        x_index = list(model.x.keys())
+        x_vals = np.fromiter(
+            (v.value or 0.0 for v in model.x.values()), dtype=np.float64, count=len(x_index)
+        )
+        start = {i: v.value for i, v in model.time_start.items()}
+        completion = {i: v.value for i, v in model.time_completion.items()}
+        for k in np.flatnonzero(x_vals > 0.5):
+            i, j, t, w = x_index[k]
+            solution['assignments'].append({
+                'order': i,
+                'line': j,
+                'time': t,
+                'worker': w,
+                'start': start[i],
+                'completion': completion[i]
+            })
 
         # Extract OTIF metrics
         for i in model.ORDERS:
             solution['otif_metrics'][i] = {
-                'late': pyo.value(model.late[i]) > 0.5,
-                'lateness': pyo.value(model.lateness[i]),
-                'early': pyo.value(model.early[i]),
+                'late': model.late[i].value > 0.5,
+                'lateness': model.lateness[i].value,
+                'early': model.early[i].value,
                 'due_date': pyo.value(model.due[i])
             }
 
         # Extract workforce metrics
         for t in model.TIME:
             solution['workforce_metrics'][t] = {
-                'workers_used': pyo.value(model.workers_used[t]),
-                'deviation_above': pyo.value(model.deviation_above[t]),
-                'deviation_below': pyo.value(model.deviation_below[t])
+                'workers_used': model.workers_used[t].value,
+                'deviation_above': model.deviation_above[t].value,
+                'deviation_below': model.deviation_below[t].value
             }
 
         # Extract WIP metrics
         for t in model.TIME:
             solution['wip_metrics'][t] = {
-                'wip_count': pyo.value(model.wip[t])
+                'wip_count': model.wip[t].value
             }
 
         # Extract line usage
         for j in model.LINES:
             solution['line_usage'].append({
                 'line': j,
-                'used': pyo.value(model.u[j]) > 0.5
+                'used': model.u[j].value > 0.5
             })
 
         return solution
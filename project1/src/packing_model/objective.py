@@ -89,7 +89,7 @@ class ObjectiveManager:
         Returns:
             Pyomo expression for OTIF term
         """
-        return sum(
+        return pyo.quicksum(
             m.priority[i] * (7 * m.late[i] + 3 * m.lateness[i])
             for i in m.ORDERS
         )
@@ -109,8 +109,8 @@ class ObjectiveManager:
         Returns:
             Pyomo expression for WIP term
         """
-        wip_count = sum(m.wip[t] for t in m.TIME)
-        total_flow_time = sum(m.time_flow[i] for i in m.ORDERS)
+        wip_count = pyo.quicksum(m.wip[t] for t in m.TIME)
+        total_flow_time = pyo.quicksum(m.time_flow[i] for i in m.ORDERS)
         return 4 * wip_count + 6 * total_flow_time
 
     def _workforce_term(self, m):
@@ -133,14 +133,14 @@ class ObjectiveManager:
         # Workforce range (difference between max and min)
         workforce_range = m.workers_max - m.workers_min
 
-        # Total deviation from target
-        total_deviation = sum(
-            m.deviation_above[t] + m.deviation_below[t]
-            for t in m.TIME
+        # Total deviation from target (one flat sum, no per-t inner sums)
+        total_deviation = (
+            pyo.quicksum(m.deviation_above[t] for t in m.TIME) +
+            pyo.quicksum(m.deviation_below[t] for t in m.TIME)
         )
 
         # Total workforce changes
-        total_changes = sum(
+        total_changes = pyo.quicksum(
             m.workforce_change[t]
             for t in m.TIME
             if t > 1
@@ -163,7 +163,7 @@ class ObjectiveManager:
         Returns:
             Pyomo expression for line utilization term
         """
-        return sum(m.u[j] for j in m.LINES)
+        return pyo.quicksum(m.u[j] for j in m.LINES)
 
     def _worker_movement_term(self, m):
         """
@@ -181,7 +181,7 @@ class ObjectiveManager:
         Returns:
             Pyomo expression for worker movement term
         """
-        return sum(
+        return pyo.quicksum(
             m.m[w, t]
             for w in m.WORKERS
             for t in m.TIME
@@ -5,6 +5,7 @@ This module defines all input parameters for the packing schedule optimization m
 Parameters are organized into logical groups for easy extension.
 """
 
+import numpy as np
 import pyomo.environ as pyo
 
 
@@ -37,6 +38,29 @@ class ParameterManager:
         self._define_otif_parameters()
         self._define_workforce_parameters()
 
+    @staticmethod
+    def _initializer(values):
+        """
+        Convert an array into a Param initializer keyed by 1-based indices.
+
+        The values are converted to Python numbers with one tolist() call,
+        so Param construction is a dict insert per element instead of a
+        rule call that indexes the numpy array.
+
+        Args:
+            values: Array-like of any dimension
+
+        Returns:
+            dict mapping 1-based indices (int for 1-D, tuples otherwise)
+            to values
+        """
+        arr = np.asarray(values)
+        if arr.ndim == 1:
+            keys = range(1, arr.size + 1)
+        else:
+            keys = (tuple(k + 1 for k in idx) for idx in np.ndindex(arr.shape))
+        return dict(zip(keys, arr.ravel().tolist()))
+
     def _define_processing_parameters(self):
         """Define parameters related to processing and setup times."""
         model = self.model
@@ -45,14 +69,14 @@ class ParameterManager:
         # Processing time for order i on line j
         model.p = pyo.Param(
             model.ORDERS, model.LINES,
-            initialize=lambda m, i, j: data['processing_time'][i-1, j-1],
+            initialize=self._initializer(data['processing_time']),
             doc="Processing time for order i on line j"
         )
 
         # Setup time between orders i and k on line j
         model.s = pyo.Param(
             model.ORDERS, model.ORDERS, model.LINES,
-            initialize=lambda m, i, k, j: data['setup_time'][i-1, k-1, j-1],
+            initialize=self._initializer(data['setup_time']),
             doc="Setup time between orders i and k on line j"
         )
 
@@ -64,13 +88,14 @@ class ParameterManager:
         # Worker availability
         model.a = pyo.Param(
             model.WORKERS, model.TIME,
-            initialize=lambda m, w, t: data['worker_availability'][w-1, t-1],
+            initialize=self._initializer(data['worker_availability']),
             doc="Worker w availability at time t"
         )
 
-        # Reserved capacity fraction
+        # Reserved capacity fraction (mutable, see PackingScheduleModel.reset_data)
         model.alpha = pyo.Param(
             initialize=data['reserved_capacity'],
+            mutable=True,
             doc="Reserved capacity fraction (e.g., 0.1 = 10%)"
         )
 
@@ -82,7 +107,7 @@ class ParameterManager:
         # Initial inventory
         model.inv0 = pyo.Param(
             model.ORDERS,
-            initialize=lambda m, i: data['initial_inventory'][i-1],
+            initialize=self._initializer(data['initial_inventory']),
             doc="Initial inventory for order i"
         )
 
@@ -91,17 +116,19 @@ class ParameterManager:
         model = self.model
         data = self.data
 
-        # Due date
+        # Due date (mutable, see PackingScheduleModel.reset_data)
         model.due = pyo.Param(
             model.ORDERS,
-            initialize=lambda m, i: data['due_date'][i-1],
+            initialize=self._initializer(data['due_date']),
+            mutable=True,
             doc="Due date for order i"
         )
 
-        # Priority weight
+        # Priority weight (mutable, see PackingScheduleModel.reset_data)
         model.priority = pyo.Param(
             model.ORDERS,
-            initialize=lambda m, i: data['priority'][i-1],
+            initialize=self._initializer(data['priority']),
+            mutable=True,
             doc="Priority weight for order i (higher = more important)"
         )
 
@@ -110,9 +137,10 @@ class ParameterManager:
         model = self.model
         data = self.data
 
-        # Target workforce level
+        # Target workforce level (mutable, see PackingScheduleModel.reset_data)
         model.workforce_target = pyo.Param(
             initialize=data['workforce_target'],
+            mutable=True,
             doc="Ideal steady-state workforce level"
         )
 
@@ -18,6 +18,10 @@ class VariableManager:
     - Define appropriate domains and bounds
     """
 
+    # Attach the doc strings below to each Var. Off by default to keep
+    # model build light; switch on when inspecting the model with pprint().
+    EMIT_DOCS = False
+
     def __init__(self, model, data):
         """
         Initialize variables on the given Pyomo model.
@@ -29,6 +33,10 @@ class VariableManager:
         self.model = model
         self.data = data
 
+        # Shared bound tuples, reused by every Var with the same range
+        self._b_workers = (0, int(data['n_workers']))
+        self._b_time = (1, int(data['n_timeslots']))
+
     def define_all_variables(self):
         """Define all decision variables for the model."""
         self._define_primary_variables()
@@ -37,63 +45,120 @@ class VariableManager:
         self._define_wip_variables()
         self._define_shipping_variables()
 
+    def _var(self, name, *sets, doc=None, **kwargs):
+        """
+        Create a Var and register it on the model under the given name.
+
+        Args:
+            name: Component name on the model (e.g. 'x')
+            *sets: Index sets of the variable (none for scalar variables)
+            doc: Description, only stored when EMIT_DOCS is enabled
+            **kwargs: Remaining pyo.Var arguments (domain, bounds, ...)
+        """
+        add_var(self.model, name, *sets, doc=doc, emit_docs=self.EMIT_DOCS, **kwargs)
+
     def _define_primary_variables(self):
         """Define primary decision variables for scheduling."""
         model = self.model
 
+        # Feasible start slots: order i on line j has to complete within the
+        # horizon (t + p(i,j) <= T), so later starts are never allocated.
+        n_timeslots = int(self.data['n_timeslots'])
+        model.start_slots = {
+            (i, j): range(1, n_timeslots - int(model.p[i, j]) + 1)
+            for i in model.ORDERS
+            for j in model.LINES
+        }
+        # (order, line, start) triples running at each slot, shared by the
+        # workforce bounds and the worker and workforce constraints
+        model.running_by_slot = running_starts_by_slot(model)
+        model.X_INDEX = pyo.Set(
+            dimen=4,
+            initialize=[
+                (i, j, t, w)
+                for (i, j), slots in model.start_slots.items()
+                for t in slots
+                for w in model.WORKERS
+            ],
+            doc="Feasible (order, line, start time, worker) combinations"
+        )
+
         # Assignment variable: order i starts on line j at time t with worker w
-        model.x = pyo.Var(
-            model.ORDERS, model.LINES, model.TIME, model.WORKERS,
+        self._var(
+            'x', model.X_INDEX,
             domain=pyo.Binary,
             doc="Order i starts on line j at time t with worker w"
         )
 
         # Setup indicator: setup between orders i and k on line j
-        model.y = pyo.Var(
-            model.ORDERS, model.ORDERS, model.LINES,
+        self._var(
+            'y', model.ORDERS, model.ORDERS, model.LINES,
             domain=pyo.Binary,
             doc="Setup between orders i and k on line j"
         )
 
+        # Batchable pairs: i < k (the relation is symmetric) and the two
+        # orders belong to the same family, i.e. switching between them
+        # needs no setup in either direction on at least one line
+        model.BATCH_PAIRS = pyo.Set(
+            dimen=2,
+            initialize=[
+                (i, k)
+                for i in model.ORDERS
+                for k in model.ORDERS
+                if i < k and any(
+                    model.s[i, k, j] == 0 and model.s[k, i, j] == 0
+                    for j in model.LINES
+                )
+            ],
+            doc="Order pairs (i < k) that can be batched together"
+        )
+
         # Batch indicator: orders i and k batched together
-        model.b = pyo.Var(
-            model.ORDERS, model.ORDERS,
+        self._var(
+            'b', model.BATCH_PAIRS,
             domain=pyo.Binary,
             doc="Orders i and k batched together"
         )
 
         # Worker working indicator
-        model.w_working = pyo.Var(
-            model.WORKERS, model.TIME,
+        self._var(
+            'w_working', model.WORKERS, model.TIME,
             domain=pyo.Binary,
             doc="Worker w is working during time t"
         )
 
         # Worker movement indicator
-        model.m = pyo.Var(
-            model.WORKERS, model.TIME,
+        self._var(
+            'm', model.WORKERS, model.TIME,
             domain=pyo.Binary,
             doc="Worker w moved to another line at time t"
         )
 
         # Production quantity
-        model.prod = pyo.Var(
-            model.ORDERS, model.TIME,
-            domain=pyo.NonNegativeIntegers,
+        # Counts, times and deviations are fully determined by the binary
+        # decisions and integer data, so they are declared continuous: the
+        # solver gets integral values without branching on them.
+        self._var(
+            'prod', model.ORDERS, model.TIME,
+            domain=pyo.NonNegativeReals,
             doc="Number of units produced for order i at time t"
         )
 
         # Inventory level
-        model.inv = pyo.Var(
-            model.ORDERS, model.TIME,
-            domain=pyo.NonNegativeIntegers,
+        self._var(
+            'inv', model.ORDERS, model.TIME,
+            domain=pyo.NonNegativeReals,
             doc="Inventory level of order i at time t"
         )
 
         # Line in use indicator
-        model.u = pyo.Var(
-            model.LINES,
-            domain=pyo.Binary,
+        # Continuous in [0, 1]: line_in_use_lower caps it by the (integer)
+        # number of assignments on line j and line_capacity forces it to 1
+        # as soon as one is made, so it is 0/1 without branching.
+        self._var(
+            'u', model.LINES,
+            domain=pyo.UnitInterval,
             doc="Line j is used"
         )
 
@@ -101,24 +166,32 @@ class VariableManager:
         """Define variables for On-Time In-Full (OTIF) tracking."""
         model = self.model
 
+        # Completion times lie in [1, T], which bounds how late or early
+        # any order can be relative to its due date
+        due_date = self.data['due_date']
+        max_lateness = max(0, self.data['n_timeslots'] - min(due_date))
+        max_earliness = max(0, max(due_date) - 1)
+
         # Late order indicator
-        model.late = pyo.Var(
-            model.ORDERS,
+        self._var(
+            'late', model.ORDERS,
             domain=pyo.Binary,
             doc="Order i is late (binary indicator)"
         )
 
         # Lateness amount
-        model.lateness = pyo.Var(
-            model.ORDERS,
-            domain=pyo.NonNegativeIntegers,
+        self._var(
+            'lateness', model.ORDERS,
+            domain=pyo.NonNegativeReals,
+            bounds=(0, max_lateness),
             doc="Amount of lateness for order i (time units)"
         )
 
         # Earliness amount
-        model.early = pyo.Var(
-            model.ORDERS,
-            domain=pyo.NonNegativeIntegers,
+        self._var(
+            'early', model.ORDERS,
+            domain=pyo.NonNegativeReals,
+            bounds=(0, max_earliness),
             doc="Amount of earliness for order i (time units)"
         )
 
@@ -126,60 +199,74 @@ class VariableManager:
         """Define variables for workforce tracking and management."""
         model = self.model
 
+        # At most one order runs per line and each order runs once, so the
+        # workers busy at tau are bounded by the distinct orders and the
+        # distinct lines that can be running then, not only by n_workers.
+        # workers_max and workers_min inherit the largest and smallest of
+        # these slot bounds.
+        n_workers = self._b_workers[1]
+        used_ub = {
+            tau: min(
+                n_workers,
+                len({i for (i, _, _) in bucket}),
+                len({j for (_, j, _) in bucket})
+            )
+            for tau, bucket in model.running_by_slot.items()
+        }
+
         # Total workers used at each time slot
-        model.workers_used = pyo.Var(
-            model.TIME,
-            domain=pyo.NonNegativeIntegers,
-            bounds=(0, self.data['n_workers']),
+        self._var(
+            'workers_used', model.TIME,
+            domain=pyo.NonNegativeReals,
+            bounds={tau: (0, ub) for tau, ub in used_ub.items()},
             doc="Total workers active at time t"
         )
 
         # Maximum workers used
-        model.workers_max = pyo.Var(
+        self._var(
+            'workers_max',
             domain=pyo.NonNegativeIntegers,
-            bounds=(0, self.data['n_workers']),
+            bounds=(0, max(used_ub.values())),
             doc="Maximum workers used in any time slot"
         )
 
         # Minimum workers used
-        model.workers_min = pyo.Var(
+        self._var(
+            'workers_min',
             domain=pyo.NonNegativeIntegers,
-            bounds=(0, self.data['n_workers']),
+            bounds=(0, min(used_ub.values())),
             doc="Minimum workers used in any time slot"
         )
 
         # Deviation above target workforce
-        model.deviation_above = pyo.Var(
-            model.TIME,
-            domain=pyo.NonNegativeIntegers,
+        self._var(
+            'deviation_above', model.TIME,
+            domain=pyo.NonNegativeReals,
+            bounds=self._b_workers,
             doc="Workers above target at time t"
         )
 
         # Deviation below target workforce
-        model.deviation_below = pyo.Var(
-            model.TIME,
-            domain=pyo.NonNegativeIntegers,
+        self._var(
+            'deviation_below', model.TIME,
+            domain=pyo.NonNegativeReals,
+            bounds=(0, self.data['workforce_target']),
             doc="Workers below target at time t"
         )
 
-        # Absolute workforce change between periods
-        model.workforce_change = pyo.Var(
-            model.TIME,
-            domain=pyo.NonNegativeIntegers,
-            doc="Absolute change in workforce from t-1 to t"
-        )
-
         # Workforce increase
-        model.workforce_increase = pyo.Var(
-            model.TIME,
-            domain=pyo.NonNegativeIntegers,
+        self._var(
+            'workforce_increase', model.TIME,
+            domain=pyo.NonNegativeReals,
+            bounds=self._b_workers,
             doc="Increase in workforce from t-1 to t"
         )
 
         # Workforce decrease
-        model.workforce_decrease = pyo.Var(
-            model.TIME,
-            domain=pyo.NonNegativeIntegers,
+        self._var(
+            'workforce_decrease', model.TIME,
+            domain=pyo.NonNegativeReals,
+            bounds=self._b_workers,
             doc="Decrease in workforce from t-1 to t"
         )
 
@@ -188,81 +275,118 @@ class VariableManager:
         model = self.model
 
         # Order start time
-        model.time_start = pyo.Var(
-            model.ORDERS,
-            domain=pyo.NonNegativeIntegers,
-            bounds=(1, self.data['n_timeslots']),
+        self._var(
+            'time_start', model.ORDERS,
+            domain=pyo.NonNegativeReals,
+            bounds=self._b_time,
             doc="Start time for order i"
         )
 
         # Order completion time
-        model.time_completion = pyo.Var(
-            model.ORDERS,
-            domain=pyo.NonNegativeIntegers,
-            bounds=(1, self.data['n_timeslots']),
+        self._var(
+            'time_completion', model.ORDERS,
+            domain=pyo.NonNegativeReals,
+            bounds=self._b_time,
             doc="Completion time for order i"
         )
 
         # Shipping time (NEW for Problem 2)
-        model.time_ship = pyo.Var(
-            model.ORDERS,
-            domain=pyo.NonNegativeIntegers,
-            bounds=(1, self.data['n_timeslots']),
+        self._var(
+            'time_ship', model.ORDERS,
+            domain=pyo.NonNegativeReals,
+            bounds=self._b_time,
             doc="Shipping time for order i"
         )
 
-        # Flow time (start to shipping)
-        model.time_flow = pyo.Var(
-            model.ORDERS,
-            domain=pyo.NonNegativeIntegers,
-            doc="Flow time (start to shipping) for order i"
-        )
-
-        # WIP indicator
-        model.wip_indicator = pyo.Var(
-            model.ORDERS, model.TIME,
-            domain=pyo.Binary,
-            doc="Order i is in process at time t"
-        )
-
         # Total WIP count
-        model.wip = pyo.Var(
-            model.TIME,
-            domain=pyo.NonNegativeIntegers,
+        self._var(
+            'wip', model.TIME,
+            domain=pyo.NonNegativeReals,
             doc="Number of orders in process at time t"
         )
 
-        # Value-weighted WIP
-        model.wip_weighted = pyo.Var(
-            model.TIME,
-            domain=pyo.NonNegativeIntegers,
-            doc="Value-weighted WIP at time t"
-        )
-
     def _define_shipping_variables(self):
         """Define variables for shipping decisions (NEW for Problem 2)."""
         model = self.model
 
         # Shipping decision: order i ships at time t
-        model.ship = pyo.Var(
-            model.ORDERS, model.TIME,
+        self._var(
+            'ship', model.ORDERS, model.TIME,
             domain=pyo.Binary,
             doc="Order i ships at time t (binary decision)"
         )
 
-        # Ship early indicator
-        model.ship_early = pyo.Var(
-            model.ORDERS,
-            domain=pyo.Binary,
-            doc="Order i ships before due date"
-        )
 
-        # Ship late indicator
-        model.ship_late = pyo.Var(
-            model.ORDERS,
-            domain=pyo.Binary,
-            doc="Order i ships after due date"
-        )
+def add_var(model, name, *sets, doc=None, emit_docs=None, **kwargs):
+    """
+    Create a Var and register it on the model under the given name.
+
+    Used by VariableManager and by constraint modules that create their
+    variables together with the constraints (e.g. wip_indicator in wip.py),
+    so every Var follows VariableManager.EMIT_DOCS.
+
+    Args:
+        model: Pyomo ConcreteModel instance
+        name: Component name on the model (e.g. 'x')
+        *sets: Index sets of the variable (none for scalar variables)
+        doc: Description, only stored when doc strings are emitted
+        emit_docs: Store the doc string (None uses VariableManager.EMIT_DOCS)
+        **kwargs: Remaining pyo.Var arguments (domain, bounds, ...)
+    """
+    if emit_docs is None:
+        emit_docs = VariableManager.EMIT_DOCS
+    if emit_docs:
+        kwargs['doc'] = doc
+    model.add_component(name, pyo.Var(*sets, **kwargs))
+
+
+def running_starts(model, i, j, tau):
+    """
+    Start slots at which order i on line j is still being processed at tau.
+
+    An order started at t is processed during t <= tau < t + p(i,j), so the
+    result is the part of start_slots[i, j] in (tau - p(i,j), tau]. Computing
+    this range directly avoids scanning every start slot for each tau.
+
+    Args:
+        model: Pyomo ConcreteModel instance (with start_slots defined)
+        i: Order index
+        j: Line index
+        tau: Time slot
+
+    Returns:
+        range of start times
+    """
+    slots = model.start_slots[i, j]
+    first = max(slots.start, tau - int(model.p[i, j]) + 1)
+    last = min(slots.stop - 1, tau)
+    return range(first, last + 1)
+
+
+def running_starts_by_slot(model):
+    """
+    Bucket every running (order, line, start) triple by time slot.
+
+    Each feasible start t of order i on line j is appended to the buckets
+    t, ..., t + p(i,j) - 1, so building all buckets is linear in the total
+    processing volume. Rules that need the running orders of every (w, tau)
+    read buckets[tau] instead of recomputing running_starts() per worker.
+
+    Args:
+        model: Pyomo ConcreteModel instance (with start_slots defined)
+
+    Returns:
+        dict mapping each time slot to a list of (i, j, t) tuples
+    """
+    buckets = {tau: [] for tau in model.TIME}
+    for (i, j), slots in model.start_slots.items():
+        p_ij = int(model.p[i, j])
+        for t in slots:
+            # One shared tuple per start, appended to each slot it covers
+            triple = (i, j, t)
+            for tau in range(t, t + p_ij):
+                buckets[tau].append(triple)
+    return buckets
 
 
 def add_variables(model, data):
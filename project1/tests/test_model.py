@@ -0,0 +1,152 @@
+"""
+Model tests for Project 1.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+import pyomo.environ as pyo
+
+# Add src directory to path to import packing_model
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from packing_model import PackingScheduleModel
+
+
+def create_small_data():
+    """Create a small instance: 3 orders, 2 lines, 1 worker."""
+    n_orders = 3
+    n_lines = 2
+    n_timeslots = 10
+    n_workers = 1
+
+    setup_time = np.ones((n_orders, n_orders, n_lines))
+    for j in range(n_lines):
+        np.fill_diagonal(setup_time[:, :, j], 0)
+
+    return {
+        'n_orders': n_orders,
+        'n_lines': n_lines,
+        'n_timeslots': n_timeslots,
+        'n_workers': n_workers,
+        'processing_time': np.array([[2, 3], [3, 2], [2, 2]]),
+        'setup_time': setup_time,
+        'worker_availability': np.ones((n_workers, n_timeslots)),
+        'initial_inventory': np.zeros(n_orders, dtype=int),
+        'shipping_schedule': np.zeros((n_orders, n_timeslots)),
+        'reserved_capacity': 0.1,
+        'due_date': np.array([4, 6, 8]),
+        'demand': np.ones(n_orders, dtype=int),
+        'priority': np.array([3, 2, 1]),
+        'workforce_target': 1,
+        'objective_weights': {
+            'alpha': 1.0,
+            'beta': 0.3,
+            'gamma': 0.2,
+            'delta': 0.5
+        }
+    }
+
+
+@pytest.fixture(scope='module')
+def solved_model():
+    """Build and solve the small instance once for all tests."""
+    pytest.importorskip('highspy')
+    model = PackingScheduleModel(create_small_data())
+    results = model.solve(solver_name='appsi_highs', tee=False)
+    assert results['termination_condition'] == pyo.TerminationCondition.optimal
+    return model
+
+
+def test_continuous_variables_are_integral_at_optimum(solved_model):
+    """Relaxed counting/timing variables still take integer values."""
+    m = solved_model.model
+    for var in m.component_data_objects(pyo.Var):
+        if var.value is None or not var.is_continuous():
+            continue
+        assert var.value == pytest.approx(round(var.value), abs=1e-6), var.name
+
+
+def create_reset_data():
+    """The small instance with new due dates, priorities and workforce target."""
+    data = create_small_data()
+    data['due_date'] = np.array([6, 4, 9])
+    data['priority'] = np.array([1, 3, 2])
+    data['workforce_target'] = 0
+    return data
+
+
+def test_reset_data_matches_fresh_model():
+    """Re-solving after reset_data() gives the objective of a fresh model."""
+    pytest.importorskip('highspy')
+    model = PackingScheduleModel(create_small_data())
+    model.solve(solver_name='appsi_highs', tee=False)
+
+    new_data = create_reset_data()
+    model.reset_data(new_data)
+    results = model.solve(solver_name='appsi_highs', tee=False)
+
+    fresh = PackingScheduleModel(new_data).solve(solver_name='appsi_highs', tee=False)
+    assert results['termination_condition'] == pyo.TerminationCondition.optimal
+    assert results['objective_value'] == pytest.approx(fresh['objective_value'])
+
+
+def test_reset_data_rejects_structural_change():
+    """Keys that shape the model cannot be swapped in place."""
+    model = PackingScheduleModel(create_small_data())
+    new_data = create_small_data()
+    new_data['processing_time'] = np.array([[3, 3], [3, 2], [2, 2]])
+    with pytest.raises(ValueError, match='processing_time'):
+        model.reset_data(new_data)
+
+
+def test_solver_options_apply_to_one_call():
+    """A later solve() does not keep the options of an earlier call."""
+    pytest.importorskip('highspy')
+    model = PackingScheduleModel(create_small_data())
+    model.solve(solver_name='appsi_highs', tee=False, mip_rel_gap=0.5)
+    first = model._solver
+    assert first.options == {'mip_rel_gap': 0.5}
+
+    # Other options: the solver is rebuilt without the earlier ones
+    results = model.solve(solver_name='appsi_highs', tee=False)
+    assert model._solver is not first
+    assert model._solver.options == {}
+    assert results['termination_condition'] == pyo.TerminationCondition.optimal
+
+    # Same options: the persistent solver is reused
+    second = model._solver
+    model.solve(solver_name='appsi_highs', tee=False)
+    assert model._solver is second
+
+
+def test_start_from_relaxation_keeps_optimum():
+    """A rounded LP-relaxation start leads to the cold-start optimum."""
+    pytest.importorskip('highspy')
+    cold = PackingScheduleModel(create_small_data()).solve(solver_name='appsi_highs', tee=False)
+
+    model = PackingScheduleModel(create_small_data())
+    assert model.set_start_from_relaxation() is True
+    warm = model.solve(solver_name='appsi_highs', tee=False, warmstart=True)
+
+    assert warm['termination_condition'] == pyo.TerminationCondition.optimal
+    assert warm['objective_value'] == pytest.approx(cold['objective_value'])
+
+
+def test_ship_sos1_builds_sos_constraint():
+    """ship_sos1 adds one SOS1 set per order, which HiGHS rejects."""
+    data = create_small_data()
+    data['ship_sos1'] = True
+    model = PackingScheduleModel(data)
+
+    sos = model.model.ship_sos
+    assert len(sos) == data['n_orders']
+    assert sos[1].level == 1
+    assert len(list(sos[1].get_variables())) == data['n_timeslots']
+
+    pytest.importorskip('highspy')
+    with pytest.raises(NotImplementedError):
+        model.solve(solver_name='appsi_highs', tee=False)
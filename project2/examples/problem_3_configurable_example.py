@@ -160,16 +160,16 @@ def generate_processing_times(n_types, n_lines, proc_min, proc_max, seed=42):
     """
     np.random.seed(seed)
 
-    processing_time = np.zeros((n_types, n_lines))
+    # Column 0 is the base processing time of each type, the other columns
+    # the variation per line (some lines faster/slower for each type, ±20%).
+    # Drawn row by row, so the values match the order of scalar draws
+    low = np.array([proc_min] + [0.8] * n_lines)
+    high = np.array([proc_max] + [1.2] * n_lines)
+    draws = np.random.uniform(low, high, size=(n_types, n_lines + 1))
 
-    for u in range(n_types):
-        # Base processing time for this type
-        base_time = np.random.uniform(proc_min, proc_max)
-
-        for j in range(n_lines):
-            # Add variation: some lines faster/slower for each type (±20%)
-            variation = np.random.uniform(0.8, 1.2)
-            processing_time[u, j] = max(proc_min, base_time * variation)
+    base_time = draws[:, 0]
+    variation = draws[:, 1:]
+    processing_time = np.maximum(proc_min, base_time[:, None] * variation)
 
     return processing_time
 
@@ -189,16 +189,13 @@ def generate_setup_times(n_types, setup_same, setup_diff, seed=42):
     """
     np.random.seed(seed + 1)
 
-    setup_time = np.zeros((n_types, n_types))
-
-    for u in range(n_types):
-        for v in range(n_types):
-            if u == v:
-                setup_time[u, v] = setup_same
-            else:
-                # Add some variation to setup times (±20%)
-                variation = np.random.uniform(0.8, 1.2)
-                setup_time[u, v] = setup_diff * variation
+    # Same type on the diagonal; switching between types elsewhere, with
+    # some variation (±20%). Boolean mask assignment fills the off-diagonal
+    # entries row by row, the order the scalar draws were consumed in
+    setup_time = np.full((n_types, n_types), float(setup_same))
+    off_diagonal = ~np.eye(n_types, dtype=bool)
+    variation = np.random.uniform(0.8, 1.2, size=n_types * (n_types - 1))
+    setup_time[off_diagonal] = setup_diff * variation
 
     return setup_time
 
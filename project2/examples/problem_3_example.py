@@ -15,12 +15,61 @@ sys.path.insert(0, os.path.join(project_root, 'src'))
 from simple_packing_model import PackingScheduleModelProblem3
 
 
+def _frozen(values):
+    """Return a read-only numpy array, safe to share between data dicts."""
+    array = np.array(values)
+    array.setflags(write=False)
+    return array
+
+
+# Sample problem data
+# The arrays are built once at import time and shared (read-only) by every
+# create_sample_data() call, so repeated runs don't reallocate them.
+
+# Processing times p(u,j): [types x lines]
+# Each type has different processing times on different lines
+PROCESSING_TIME = _frozen([
+    [10.0, 12.0],  # Type 1: 10 on line 1, 12 on line 2
+    [15.0, 13.0],  # Type 2: 15 on line 1, 13 on line 2
+])
+
+# Setup times s(u,v): [types x types]
+# Time to change from type u to type v
+SETUP_TIME = _frozen([
+    [0.0, 5.0],   # From type 1: no setup to 1, 5 to type 2
+    [5.0, 0.0],   # From type 2: 5 to type 1, no setup to 2
+])
+
+# Initial inventory inv0(u): [types]
+INITIAL_INVENTORY = _frozen([0, 0])
+
+# Order types: which type each order produces
+# Orders 1,2 are type 1; Orders 3,4 are type 2
+ORDER_TYPE = _frozen([1, 1, 2, 2])
+
+# Demand data
+# Each demand specifies: due date, product type, quantity
+
+# due(d): Due dates for each demand
+DUE_DATE = _frozen([20.0, 40.0])
+
+# prodtype(d): Product type for each demand
+DEMAND_TYPE = _frozen([1, 2])
+
+# qty(d): Quantity for each demand
+DEMAND_QTY = _frozen([2, 2])
+
+# priority(i): Priority weights for orders (higher = more important)
+PRIORITY = _frozen([10, 10, 10, 10])
+
+
 def create_sample_data():
     """
     Create sample problem data for the Problem_3 model.
 
     Returns:
-        Dictionary with all required input data.
+        Dictionary with all required input data. The numpy arrays are the
+        shared read-only module constants; copy them before modifying.
     """
 
     # Problem dimensions
@@ -32,42 +81,6 @@ def create_sample_data():
     # Planning horizon
     T_max = 60.0
 
-    # Processing times p(u,j): [types x lines]
-    # Each type has different processing times on different lines
-    processing_time = np.array([
-        [10.0, 12.0],  # Type 1: 10 on line 1, 12 on line 2
-        [15.0, 13.0],  # Type 2: 15 on line 1, 13 on line 2
-    ])
-
-    # Setup times s(u,v): [types x types]
-    # Time to change from type u to type v
-    setup_time = np.array([
-        [0.0, 5.0],   # From type 1: no setup to 1, 5 to type 2
-        [5.0, 0.0],   # From type 2: 5 to type 1, no setup to 2
-    ])
-
-    # Initial inventory inv0(u): [types]
-    initial_inventory = np.array([0, 0])
-
-    # Order types: which type each order produces
-    # Orders 1,2 are type 1; Orders 3,4 are type 2
-    order_type = np.array([1, 1, 2, 2])
-
-    # Demand data
-    # Each demand specifies: due date, product type, quantity
-
-    # due(d): Due dates for each demand
-    due_date = np.array([20.0, 40.0])
-
-    # prodtype(d): Product type for each demand
-    demand_type = np.array([1, 2])
-
-    # qty(d): Quantity for each demand
-    demand_qty = np.array([2, 2])
-
-    # priority(i): Priority weights for orders (higher = more important)
-    priority = np.array([10, 10, 10, 10])
-
     # Objective weights
     objective_weights = {
         'alpha': 1.0,  # OTIF weight
@@ -82,14 +95,14 @@ def create_sample_data():
         'n_demands': n_demands,
         'n_lines': n_lines,
         'T_max': T_max,
-        'processing_time': processing_time,
-        'setup_time': setup_time,
-        'initial_inventory': initial_inventory,
-        'order_type': order_type,
-        'due_date': due_date,
-        'demand_type': demand_type,
-        'demand_qty': demand_qty,
-        'priority': priority,
+        'processing_time': PROCESSING_TIME,
+        'setup_time': SETUP_TIME,
+        'initial_inventory': INITIAL_INVENTORY,
+        'order_type': ORDER_TYPE,
+        'due_date': DUE_DATE,
+        'demand_type': DEMAND_TYPE,
+        'demand_qty': DEMAND_QTY,
+        'priority': PRIORITY,
         'objective_weights': objective_weights
     }
 
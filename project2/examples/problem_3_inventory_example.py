@@ -130,6 +130,29 @@ def create_inventory_test_data():
     return data
 
 
+def fill_timeline(starts, completes, types, max_time):
+    """
+    Mark which product type is being produced at each integer time.
+
+    Each order fills its [start, completion) range with one slice
+    assignment instead of a per-time-unit loop.
+
+    Args:
+        starts: Integer start times of the scheduled orders
+        completes: Integer completion times of the scheduled orders
+        types: Product type of each scheduled order
+        max_time: Last time shown on the timeline
+
+    Returns:
+        int8 array of length max_time + 1 with the type in production at
+        each time (0 where the line is idle)
+    """
+    timeline = np.zeros(max_time + 1, dtype=np.int8)
+    for start, complete, prod_type in zip(starts, completes, types):
+        timeline[start:min(complete, max_time + 1)] = prod_type
+    return timeline
+
+
 def analyze_inventory_usage(model, data):
     """
     Analyze how initial inventory was used vs. production.
@@ -140,6 +163,16 @@ def analyze_inventory_usage(model, data):
     """
     solution = model.get_solution()
 
+    # Column arrays of the solution, pulled out once
+    assignment_arrays = solution['assignment_arrays']
+    order = assignment_arrays['order']
+    line = assignment_arrays['line']
+    start = assignment_arrays['start']
+    completion = assignment_arrays['completion']
+    duration = completion - start
+    order_types = np.asarray(data['order_type'])[order - 1]
+    ship_time = solution['demand_arrays']['ship_time']  # indexed by demand - 1
+
     print("\n" + "="*80)
     print("INVENTORY USAGE ANALYSIS")
     print("="*80)
@@ -180,23 +213,14 @@ def analyze_inventory_usage(model, data):
     # Display production schedule
     print("\n--- ACTUAL PRODUCTION SCHEDULE ---")
 
-    if solution['assignments']:
+    if order.size:
         print(f"\n{'Order':<8} {'Type':<8} {'Line':<8} {'Start':<10} {'Complete':<12} {'Duration'}")
         print("-" * 70)
 
-        total_produced = {1: 0, 2: 0}
-        for assignment in sorted(solution['assignments'], key=lambda x: x['start']):
-            order_id = assignment['order']
-            order_idx = order_id - 1
-            prod_type = data['order_type'][order_idx]
-            line = assignment['line']
-            start = assignment['start']
-            complete = assignment['completion']
-            duration = complete - start
-
-            total_produced[prod_type] += 1
-
-            print(f"{order_id:<8} {prod_type:<8} {line:<8} {start:<10.1f} {complete:<12.1f} {duration:.1f}")
+        total_produced = {u: int(np.count_nonzero(order_types == u)) for u in (1, 2)}
+        for idx in np.argsort(start, kind='stable'):
+            print(f"{order[idx]:<8} {order_types[idx]:<8} {line[idx]:<8} {start[idx]:<10.1f} "
+                  f"{completion[idx]:<12.1f} {duration[idx]:.1f}")
 
         print(f"\nTotal produced:")
         print(f"  Type 1: {total_produced[1]} units (needed {type1_needed})")
@@ -212,37 +236,30 @@ def analyze_inventory_usage(model, data):
     inventory_used = {1: 0, 2: 0}
     production_used = {1: 0, 2: 0}
 
+    # Earliest completion per type, in one pass over the assignments
+    earliest_prod_by_type = {
+        u: completion[order_types == u].min() for u in np.unique(order_types)
+    }
+
     for d_idx in range(data['n_demands']):
         demand_id = d_idx + 1
         prod_type = data['demand_type'][d_idx]
         qty = data['demand_qty'][d_idx]
         due = data['due_date'][d_idx]
+        shipped_at = ship_time[d_idx]
+        status = "On-time" if shipped_at <= due else f"Late ({shipped_at - due:.1f})"
+
+        # Determine source (heuristic: if shipped before any production completes, it's from inventory)
+        earliest_production = earliest_prod_by_type.get(prod_type, float('inf'))
 
-        # Find corresponding demand fulfillment
-        demand_info = next((d for d in solution['demands'] if d['demand'] == demand_id), None)
-
-        if demand_info:
-            ship_time = demand_info['ship_time']
-            status = "On-time" if ship_time <= due else f"Late ({ship_time - due:.1f})"
-
-            # Determine source (heuristic: if shipped before any production completes, it's from inventory)
-            earliest_production = float('inf')
-            if solution['assignments']:
-                for assignment in solution['assignments']:
-                    order_idx = assignment['order'] - 1
-                    if data['order_type'][order_idx] == prod_type:
-                        earliest_production = min(earliest_production, assignment['completion'])
-
-            if ship_time < earliest_production:
-                source = "Inventory"
-                inventory_used[prod_type] += qty
-            else:
-                source = "Production"
-                production_used[prod_type] += qty
-
-            print(f"{demand_id:<10} {prod_type:<8} {qty:<8} {due:<10.1f} {ship_time:<10.1f} {status:<12} {source}")
+        if shipped_at < earliest_production:
+            source = "Inventory"
+            inventory_used[prod_type] += qty
         else:
-            print(f"{demand_id:<10} {prod_type:<8} {qty:<8} {due:<10.1f} {'--':<10} {'Not shipped':<12} --")
+            source = "Production"
+            production_used[prod_type] += qty
+
+        print(f"{demand_id:<10} {prod_type:<8} {qty:<8} {due:<10.1f} {shipped_at:<10.1f} {status:<12} {source}")
 
     # Summary
     print("\n--- INVENTORY VS. PRODUCTION SUMMARY ---")
@@ -261,67 +278,45 @@ def analyze_inventory_usage(model, data):
     # Timeline visualization
     print("\n--- TIMELINE VISUALIZATION ---\n")
 
-    max_time = min(50, int(max([d['ship_time'] for d in solution['demands']] +
-                               [a['completion'] for a in solution['assignments']] +
-                               [data['due_date'].max()])) + 5)
+    max_time = min(50, int(max(ship_time.max(),
+                               completion.max(initial=0.0),
+                               data['due_date'].max())) + 5)
 
-    print("Time:      ", end="")
-    for t in range(0, max_time + 1, 5):
-        print(f"{t:>5}", end="")
-    print()
+    # One column every 5 time units
+    ticks = np.arange(0, max_time + 1, 5)
 
-    print("           ", end="")
-    for t in range(0, max_time + 1, 5):
-        print("    |", end="")
-    print()
+    print("Time:      " + "".join(f"{t:>5}" for t in ticks))
+    print("           " + "    |" * ticks.size)
 
     # Production timeline
-    if solution['assignments']:
-        print("Production:", end="")
-        timeline = [' '] * (max_time + 1)
-        for assignment in solution['assignments']:
-            order_id = assignment['order']
-            order_idx = order_id - 1
-            prod_type = data['order_type'][order_idx]
-            start = int(assignment['start'])
-            complete = int(assignment['completion'])
-            for t in range(start, min(complete, max_time + 1)):
-                timeline[t] = str(prod_type)
-
-        for i in range(0, max_time + 1):
-            if i % 5 == 0:
-                print(f"{timeline[i]:>5}", end="")
-        print()
-
-    # Shipping timeline
-    print("Shipping:  ", end="")
-    ship_timeline = [' '] * (max_time + 1)
-    for demand_info in solution['demands']:
-        demand_id = demand_info['demand']
-        demand_idx = demand_id - 1
-        prod_type = data['demand_type'][demand_idx]
-        ship_time = int(demand_info['ship_time'])
-        if ship_time <= max_time:
-            ship_timeline[ship_time] = f"D{demand_id}"
-
-    for i in range(0, max_time + 1):
-        if i % 5 == 0:
-            if ship_timeline[i] != ' ':
-                print(f"{ship_timeline[i]:>5}", end="")
-            else:
-                print(f"{ship_timeline[i]:>5}", end="")
-    print()
-
-    # Due dates
-    print("Due Dates: ", end="")
-    for i in range(0, max_time + 1):
-        if i % 5 == 0:
-            due_here = [d_idx + 1 for d_idx, due in enumerate(data['due_date']) if abs(due - i) < 0.1]
-            if due_here:
-                print(f" D{due_here[0]}", end="  ")
-            else:
-                print("     ", end="")
-    print("\n")
+    if order.size:
+        timeline = fill_timeline(
+            start.astype(np.int32), completion.astype(np.int32), order_types.astype(np.int8), max_time
+        )
+
+        print("Production:" + "".join(
+            f"{(str(prod_type) if prod_type else ' '):>5}" for prod_type in timeline[ticks]
+        ))
+
+    # Shipping timeline: demand id shipped at each integer time (0 = none)
+    demand_ids = solution['demand_arrays']['demand']
+    ship_times = ship_time.astype(np.int32)
+    in_view = ship_times <= max_time
+    ship_timeline = np.zeros(max_time + 1, dtype=np.int32)
+    ship_timeline[ship_times[in_view]] = demand_ids[in_view]
+
+    print("Shipping:  " + "".join(
+        f"{(f'D{demand_id}' if demand_id else ' '):>5}" for demand_id in ship_timeline[ticks]
+    ))
+
+    # Due dates: first demand due at each tick
+    due_at_tick = np.abs(np.asarray(data['due_date'])[None, :] - ticks[:, None]) < 0.1
+    first_due = due_at_tick.argmax(axis=1) + 1
+
+    print("Due Dates: " + "".join(
+        f" D{demand_id}  " if has_due else "     "
+        for has_due, demand_id in zip(due_at_tick.any(axis=1), first_due)
+    ) + "\n")
 
     print("="*80)
 
@@ -369,6 +364,10 @@ def main():
     model = PackingScheduleModelProblem3(data)
     print("  Model built successfully!")
 
+    # Greedy inventory-first schedule as MIP start
+    warmstart = model.set_heuristic_start()
+    print(f"  Heuristic warm start: {'set' if warmstart else 'not found'}")
+
     # Solve
     print("\n[Step 3] Solving optimization problem...")
     print("  Optimizer will decide when to use inventory vs. production...")
@@ -379,7 +378,9 @@ def main():
         results = model.solve(
             solver_name='appsi_highs',
             tee=False,
-            time_limit=300
+            time_limit=300,
+            warmstart=warmstart,
+            threads=os.cpu_count()
         )
 
         print(f"\n  Status: {results['status']}")
@@ -6,9 +6,11 @@ Implements:
 - Processing time relationship
 - Time horizon constraints
 - Line utilization: Track which lines are in use
+- Symmetry breaking between lines with identical processing times
 """
 
 import pyomo.environ as pyo
+from pyomo.core.expr.numeric_expr import LinearExpression
 
 
 def define_assignment_constraints(model):
@@ -20,10 +22,23 @@ def define_assignment_constraints(model):
     2. Processing time: c(i) = s(i) + ∑_j p(i,j) * x(i,j)  ∀i
     3. Time horizon: s(i) ≥ 0  ∀i
                      c(i) ≤ T_max  ∀i
+       (enforced by the variable bounds)
     4. Line utilization: [u(j) = 1] ⇒ [∑_i x(i,j) > 0]  ∀j
-                         [u(j) = 0] ⇒ [∑_i x(i,j) = 0]  ∀j
+                         [u(j) = 0] ⇒ [x(i,j) = 0]  ∀i,j
+    5. Symmetry breaking (not in Problem_3.pdf): for consecutive lines
+       j < j' with identical processing times,
+       ∑_i x(i,j) ≥ ∑_i x(i,j') and u(j) ≥ u(j')
     """
 
+    # Single-line instances (e.g. the inventory example) have no choice of
+    # line, which makes some rows trivially satisfied
+    single_line = len(model.LINES) == 1
+
+    # Row bodies are built as LinearExpression objects from index lists
+    # materialized once, as in wip.py and workforce.py
+    orders = list(model.ORDERS)
+    lines = list(model.LINES)
+
     def one_assignment_rule(m, i):
         """
         Each order i is assigned to at most one line.
@@ -31,8 +46,17 @@ def define_assignment_constraints(model):
         ∑_j x(i,j) ≤ 1  ∀i
 
         Note: "at most" allows for orders not being scheduled if needed.
+
+        With a single line the row reduces to x(i,1) ≤ 1, which is already
+        the bound of the binary, so it is skipped.
         """
-        return sum(m.x[i, j] for j in m.LINES) <= 1
+        if single_line:
+            return pyo.Constraint.Skip
+        body = LinearExpression(
+            linear_coefs=[1.0] * len(lines),
+            linear_vars=[m.x[i, j] for j in lines]
+        )
+        return body <= 1
 
     model.one_assignment = pyo.Constraint(
         model.ORDERS,
@@ -40,6 +64,14 @@ def define_assignment_constraints(model):
         doc="Each order assigned to at most one line"
     )
 
+    # p(type(i), j) per order as plain floats, read once instead of two
+    # Param lookups per term
+    p_order = {
+        (i, j): float(model.p[model.order_type[i], j])
+        for i in model.ORDERS
+        for j in model.LINES
+    }
+
     def processing_time_rule(m, i):
         """
         Completion time equals start time plus processing time.
@@ -48,11 +80,12 @@ def define_assignment_constraints(model):
 
         Note: We need to use p(type(i), j) since processing time is by type.
         """
-        order_type = m.order_type[i]
-        return m.complete[i] == m.start[i] + sum(
-            m.p[order_type, j] * m.x[i, j]
-            for j in m.LINES
+        # c(i) - s(i) - ∑_j p(type(i), j) * x(i,j) = 0
+        body = LinearExpression(
+            linear_coefs=[1.0, -1.0] + [-p_order[i, j] for j in lines],
+            linear_vars=[m.complete[i], m.start[i]] + [m.x[i, j] for j in lines]
         )
+        return body == 0
 
     model.processing_time = pyo.Constraint(
         model.ORDERS,
@@ -60,35 +93,8 @@ def define_assignment_constraints(model):
         doc="Completion time = start time + processing time"
     )
 
-    def start_time_nonneg_rule(m, i):
-        """
-        Start time must be non-negative.
-
-        s(i) ≥ 0  ∀i
-
-        Note: This is already enforced by variable bounds, but included for clarity.
-        """
-        return m.start[i] >= 0
-
-    model.start_time_nonneg = pyo.Constraint(
-        model.ORDERS,
-        rule=start_time_nonneg_rule,
-        doc="Start times are non-negative"
-    )
-
-    def completion_within_horizon_rule(m, i):
-        """
-        Completion time must be within planning horizon.
-
-        c(i) ≤ T_max  ∀i
-        """
-        return m.complete[i] <= m.T_max_param
-
-    model.completion_within_horizon = pyo.Constraint(
-        model.ORDERS,
-        rule=completion_within_horizon_rule,
-        doc="Completion times within planning horizon"
-    )
+    # Time horizon: s(i) ≥ 0 and c(i) ≤ T_max are the bounds of the start
+    # and complete variables, so no rows are added for them
 
     # ============================================
     # Line Utilization Constraints
@@ -100,12 +106,20 @@ def define_assignment_constraints(model):
 
         [u(j) = 1] ⇒ [∑_i x(i,j) > 0]
 
-        Reformulated as: ∑_i x(i,j) ≥ epsilon * u(j)
+        Reformulated as: ∑_i x(i,j) ≥ u(j)
 
-        This ensures that if u(j) = 1, then at least one order is assigned.
-        We use epsilon (small positive value) instead of strict > 0.
+        The x(i,j) are binary, so ∑_i x(i,j) > 0 means ∑_i x(i,j) ≥ 1 and
+        the row is exact without an epsilon. It is also the tightest linear
+        form: the epsilon row ∑_i x(i,j) ≥ epsilon * u(j) let the LP
+        relaxation keep u(j) = 1 with only epsilon worth of assignments,
+        and a gdp.hull reformulation of the implication reduces to this row.
         """
-        return sum(m.x[i, j] for i in m.ORDERS) >= m.epsilon * m.u[j]
+        # ∑_i x(i,j) - u(j) ≥ 0
+        body = LinearExpression(
+            linear_coefs=[1.0] * len(orders) + [-1.0],
+            linear_vars=[m.x[i, j] for i in orders] + [m.u[j]]
+        )
+        return body >= 0
 
     model.line_used_if_assigned = pyo.Constraint(
         model.LINES,
@@ -113,24 +127,73 @@ def define_assignment_constraints(model):
         doc="If line in use, at least one order assigned"
     )
 
-    def line_not_used_if_empty_rule(m, j):
+    def line_not_used_if_empty_rule(m, i, j):
         """
         If line j is not in use, no orders can be assigned to it.
 
         [u(j) = 0] ⇒ [∑_i x(i,j) = 0]
 
-        Reformulated as: ∑_i x(i,j) ≤ M * u(j)
+        Disaggregated as: x(i,j) ≤ u(j)  ∀i,j
 
-        This ensures that if u(j) = 0, then no orders are assigned.
-        If u(j) = 1, the constraint is relaxed (up to M orders allowed).
+        Summing these rows gives the aggregated big-M form
+        ∑_i x(i,j) ≤ n_orders * u(j), but its LP relaxation is much weaker:
+        a fractional x(i,j) = 1 / n_orders only needs u(j) ≥ 1 / n_orders
+        there, while here u(j) must cover the largest x(i,j) on the line.
         """
-        # M can be the total number of orders as upper bound
-        return sum(m.x[i, j] for i in m.ORDERS) <= m.n_orders * m.u[j]
+        body = LinearExpression(
+            linear_coefs=[1.0, -1.0],
+            linear_vars=[m.x[i, j], m.u[j]]
+        )
+        return body <= 0
 
     model.line_not_used_if_empty = pyo.Constraint(
-        model.LINES,
+        model.ORDERS, model.LINES,
         rule=line_not_used_if_empty_rule,
         doc="If line not in use, no orders assigned"
     )
 
+    # ============================================
+    # Symmetry Breaking
+    # ============================================
+
+    # Lines with identical processing times can be relabelled freely, so
+    # every schedule has an equivalent one where, within each group of
+    # identical lines, lower-numbered lines carry at least as many orders.
+    # Requiring that removes the permuted copies from the search.
+    line_pairs = [
+        (j, j_next)
+        for group in model.identical_lines
+        for j, j_next in zip(group, group[1:])
+    ]
+
+    def line_symmetry_rule(m, j, j_next):
+        """
+        ∑_i x(i,j) ≥ ∑_i x(i,j')  for consecutive identical lines j < j'
+        """
+        body = LinearExpression(
+            linear_coefs=[1.0] * len(orders) + [-1.0] * len(orders),
+            linear_vars=[m.x[i, j] for i in orders] + [m.x[i, j_next] for i in orders]
+        )
+        return body >= 0
+
+    model.line_symmetry = pyo.Constraint(
+        line_pairs,
+        rule=line_symmetry_rule,
+        doc="Identical lines are filled in index order"
+    )
+
+    def line_use_symmetry_rule(m, j, j_next):
+        """
+        u(j) ≥ u(j')  for consecutive identical lines j < j'
+
+        Implied by line_symmetry for integer x, but tightens the LP relaxation.
+        """
+        return m.u[j] >= m.u[j_next]
+
+    model.line_use_symmetry = pyo.Constraint(
+        line_pairs,
+        rule=line_use_symmetry_rule,
+        doc="Identical lines are used in index order"
+    )
+
     return model
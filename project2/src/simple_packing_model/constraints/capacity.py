@@ -10,7 +10,9 @@ From Problem_3.pdf Page 4:
 These constraints ensure no overlap of orders on the same line, accounting for setup times.
 """
 
+import numpy as np
 import pyomo.environ as pyo
+from pyomo.core.expr.numeric_expr import LinearExpression
 
 
 def define_capacity_constraints(model):
@@ -21,13 +23,33 @@ def define_capacity_constraints(model):
     - If both orders i and k are on line j, one must complete (with setup) before the other starts
     - y(i,k) = 1 means i is scheduled before k
     - y(i,k) = 0 means k is scheduled before i
+
+    Each ordered pair uses its own Big-M, M_pair(i,k) = T_max + setup, which
+    is the smallest value that keeps the relaxed constraint valid. Both
+    constraints are indexed by ORDER_PAIRS (i < k) only, and their
+    right-hand sides are built as LinearExpression objects directly from
+    plain floats, instead of through Pyomo's overloaded operators.
+
+    The forward/backward pair is the big-M form of one disjunction per
+    (i, k, j). Stating it as a pyomo.gdp Disjunction would not shrink the
+    model: HiGHS has no native disjunctions, and the gdp.bigm
+    transformation produces the same two rows per triple.
     """
 
+    # Plain Python lookups, read once instead of per rule call
+    order_type = {i: int(model.order_type[i]) for i in model.ORDERS}
+    setup_time = {
+        (u, v): float(model.setup_time[u, v])
+        for u in model.TYPES
+        for v in model.TYPES
+    }
+    M_pair = {(i, k): float(model.M_pair[i, k]) for (i, k) in model.M_pair}
+
     def no_overlap_forward_rule(m, i, k, j):
         """
         If i is before k on the same line, k must start after i completes plus setup.
 
-        s(k) ≥ c(i) + s(type(i), type(k)) - T_max * (3 - x(i,j) - x(k,j) - y(i,k))
+        s(k) ≥ c(i) + s(type(i), type(k)) - M(i,k) * (3 - x(i,j) - x(k,j) - y(i,k))
 
         The constraint is active when:
         - x(i,j) = 1 (order i on line j)
@@ -36,20 +58,17 @@ def define_capacity_constraints(model):
 
         Then: s(k) ≥ c(i) + s(type(i), type(k))
         """
-        if i >= k:
-            return pyo.Constraint.Skip
-
-        # Get the types for setup time lookup
-        type_i = m.order_type[i]
-        type_k = m.order_type[k]
+        setup = setup_time[order_type[i], order_type[k]]
+        big_m = M_pair[i, k]
 
-        return m.start[k] >= (
-            m.complete[i] + m.setup_time[type_i, type_k] -
-            m.T_max_param * (3 - m.x[i, j] - m.x[k, j] - m.y[i, k])
+        return m.start[k] >= LinearExpression(
+            constant=setup - 3 * big_m,
+            linear_coefs=[1.0, big_m, big_m, big_m],
+            linear_vars=[m.complete[i], m.x[i, j], m.x[k, j], m.y[i, k]]
         )
 
     model.no_overlap_forward = pyo.Constraint(
-        model.ORDERS, model.ORDERS, model.LINES,
+        model.ORDER_PAIRS, model.LINES,
         rule=no_overlap_forward_rule,
         doc="Order k starts after order i completes (if i before k on same line)"
     )
@@ -58,7 +77,7 @@ def define_capacity_constraints(model):
         """
         If k is before i on the same line, i must start after k completes plus setup.
 
-        s(i) ≥ c(k) + s(type(k), type(i)) - T_max * (2 - x(i,j) - x(k,j) + y(i,k))
+        s(i) ≥ c(k) + s(type(k), type(i)) - M(k,i) * (2 - x(i,j) - x(k,j) + y(i,k))
 
         The constraint is active when:
         - x(i,j) = 1 (order i on line j)
@@ -67,22 +86,60 @@ def define_capacity_constraints(model):
 
         Then: s(i) ≥ c(k) + s(type(k), type(i))
         """
-        if i >= k:
-            return pyo.Constraint.Skip
+        setup = setup_time[order_type[k], order_type[i]]
+        big_m = M_pair[k, i]
 
-        # Get the types for setup time lookup
-        type_i = m.order_type[i]
-        type_k = m.order_type[k]
-
-        return m.start[i] >= (
-            m.complete[k] + m.setup_time[type_k, type_i] -
-            m.T_max_param * (2 - m.x[i, j] - m.x[k, j] + m.y[i, k])
+        return m.start[i] >= LinearExpression(
+            constant=setup - 2 * big_m,
+            linear_coefs=[1.0, big_m, big_m, -big_m],
+            linear_vars=[m.complete[k], m.x[i, j], m.x[k, j], m.y[i, k]]
         )
 
     model.no_overlap_backward = pyo.Constraint(
-        model.ORDERS, model.ORDERS, model.LINES,
+        model.ORDER_PAIRS, model.LINES,
         rule=no_overlap_backward_rule,
         doc="Order i starts after order k completes (if k before i on same line)"
     )
 
+    # ============================================
+    # Symmetry Breaking
+    # ============================================
+
+    # Orders with the same type and priority are interchangeable: swapping
+    # them in any schedule gives another schedule with the same objective.
+    # Sorting by (type, priority) with a stable sort lines each group up in
+    # index order, and consecutive members are paired.
+    types = np.array([order_type[i] for i in model.ORDERS])
+    priorities = np.array([int(model.priority[i]) for i in model.ORDERS])
+    order = np.lexsort((priorities, types))
+    same = (
+        (types[order[1:]] == types[order[:-1]]) &
+        (priorities[order[1:]] == priorities[order[:-1]])
+    )
+    model.SYM_PAIRS = pyo.Set(
+        dimen=2,
+        initialize=[
+            (int(order[p]) + 1, int(order[p + 1]) + 1)
+            for p in np.flatnonzero(same)
+        ],
+        doc="Consecutive pairs (i, k) of interchangeable orders"
+    )
+
+    def symmetry_breaking_rule(m, i, k):
+        """
+        Interchangeable orders start in index order.
+
+        s(i) ≤ s(k)  ∀(i,k) ∈ SYM_PAIRS
+
+        Removes the equivalent relabelings of identical orders from the
+        search space without cutting off any objective value.
+        """
+        return m.start[i] <= m.start[k]
+
+    model.symmetry_breaking = pyo.Constraint(
+        model.SYM_PAIRS,
+        rule=symmetry_breaking_rule,
+        doc="Interchangeable orders start in index order"
+    )
+
     return model
@@ -44,22 +44,8 @@ def define_otif_constraints(model):
         doc="Lateness is at least ship_time - due_date"
     )
 
-    def lateness_nonnegative_rule(m, d):
-        """
-        Lateness must be non-negative.
-
-        lateness(d) ≥ 0  ∀d
-
-        This is automatically enforced by the variable domain (NonNegativeReals),
-        but we include it explicitly for clarity and to match the PDF specification.
-        """
-        return m.lateness[d] >= 0
-
-    model.lateness_nonnegative = pyo.Constraint(
-        model.DEMANDS,
-        rule=lateness_nonnegative_rule,
-        doc="Lateness must be non-negative"
-    )
+    # lateness(d) ≥ 0 is enforced by the NonNegativeReals domain of
+    # model.lateness (variables.py), so it needs no constraint row.
 
     def late_if_positive_lateness_rule(m, d):
         """
@@ -85,12 +71,13 @@ def define_otif_constraints(model):
 
         [late(d) = 0] ⇒ [lateness(d) = 0]
 
-        Reformulated as: lateness(d) ≤ M * late(d)
+        Reformulated as: lateness(d) ≤ M_due(d) * late(d)
 
         This ensures that if late(d) = 0, lateness must be 0.
-        If late(d) = 1, lateness can be up to M (large enough to not constrain).
+        If late(d) = 1, lateness can be up to M_due(d) = T_max - due(d),
+        the largest lateness possible within the horizon.
         """
-        return m.lateness[d] <= m.M * m.late[d]
+        return m.lateness[d] <= m.M_due[d] * m.late[d]
 
     model.not_late_if_zero_lateness = pyo.Constraint(
         model.DEMANDS,
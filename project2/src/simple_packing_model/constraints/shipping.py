@@ -10,6 +10,7 @@ From Problem_3.pdf Page 6:
 """
 
 import pyomo.environ as pyo
+from pyomo.core.expr.numeric_expr import LinearExpression
 
 
 def define_shipping_constraints(model):
@@ -20,23 +21,36 @@ def define_shipping_constraints(model):
     1. Tracking produced items: prodbefore(u,d) = ∑_{i:type(i)=u} prodorder(i,d)
     2. Order timing and assignment: [prodorder(i,d) = 1] ⇒ [c(i) ≤ ship(d) ∧ x(i,j) = 1]
                                     [prodorder(i,d) = 0] ⇒ [c(i) ≥ ship(d) + ε]
-    3. Ship time bounds: ship(d) ≤ T_max  ∀d
+    3. Ship time bounds: ship(d) ≤ T_max  ∀d (variable bound)
     4. Ship no earlier: ship(d) ≥ due(d)  ∀d
+
+    The implications in 2. are written as big-M rows with the per-demand
+    M_due(d) and M_ship. HiGHS has no indicator constraints, and
+    LogicalConstraint + logical_to_disjunctive + gdp.bigm would derive M
+    from the variable bounds alone (ship(d) ≥ 0), which is looser than
+    M_due(d) = T_max - due(d).
     """
 
+    # The sums below are built as LinearExpression bodies from index lists
+    # materialized once, as in assignment.py
+    lines = list(model.LINES)
+
     def track_produced_items_rule(m, u, d):
         """
         Track how many units of type u are produced before demand d ships.
 
         prodbefore(u,d) = ∑_{i:type(i)=u} prodorder(i,d)
 
-        This sums up all orders of type u that complete before demand d.
+        This sums up all orders of type u that complete before demand d,
+        iterating the precomputed orders_of_type[u] only.
         """
-        return m.prodbefore[u, d] == sum(
-            m.prodorder[i, d]
-            for i in m.ORDERS
-            if m.order_type[i] == u
+        # prodbefore(u,d) - ∑_{i:type(i)=u} prodorder(i,d) = 0
+        orders = m.orders_of_type[u]
+        body = LinearExpression(
+            linear_coefs=[1.0] + [-1.0] * len(orders),
+            linear_vars=[m.prodbefore[u, d]] + [m.prodorder[i, d] for i in orders]
         )
+        return body == 0
 
     model.track_produced_items = pyo.Constraint(
         model.TYPES, model.DEMANDS,
@@ -50,9 +64,12 @@ def define_shipping_constraints(model):
 
         [prodorder(i,d) = 1] ⇒ [c(i) ≤ ship(d)]
 
-        Reformulated as: c(i) ≤ ship(d) + M * (1 - prodorder(i,d))
+        Reformulated as: c(i) ≤ ship(d) + M_due(d) * (1 - prodorder(i,d))
+
+        With c(i) ≤ T_max and ship(d) ≥ due(d), M_due(d) = T_max - due(d)
+        is large enough.
         """
-        return m.complete[i] <= m.ship[d] + m.M * (1 - m.prodorder[i, d])
+        return m.complete[i] <= m.ship[d] + m.M_due[d] * (1 - m.prodorder[i, d])
 
     model.order_before_shipping = pyo.Constraint(
         model.ORDERS, model.DEMANDS,
@@ -73,7 +90,12 @@ def define_shipping_constraints(model):
         This ensures that if prodorder(i,d) = 1, then the order must be assigned
         to at least one line. If prodorder(i,d) = 0, this constraint is trivially satisfied.
         """
-        return sum(m.x[i, j] for j in m.LINES) >= m.prodorder[i, d]
+        # ∑_j x(i,j) - prodorder(i,d) ≥ 0
+        body = LinearExpression(
+            linear_coefs=[1.0] * len(lines) + [-1.0],
+            linear_vars=[m.x[i, j] for j in lines] + [m.prodorder[i, d]]
+        )
+        return body >= 0
 
     model.order_assignment_required = pyo.Constraint(
         model.ORDERS, model.DEMANDS,
@@ -87,9 +109,12 @@ def define_shipping_constraints(model):
 
         [prodorder(i,d) = 0] ⇒ [c(i) ≥ ship(d) + ε]
 
-        Reformulated as: c(i) ≥ ship(d) + epsilon - M * prodorder(i,d)
+        Reformulated as: c(i) ≥ ship(d) + epsilon - M_ship * prodorder(i,d)
+
+        With ship(d) ≤ T_max and c(i) ≥ 0, M_ship = T_max + epsilon is
+        large enough.
         """
-        return m.complete[i] >= m.ship[d] + m.epsilon - m.M * m.prodorder[i, d]
+        return m.complete[i] >= m.ship[d] + m.epsilon - m.M_ship * m.prodorder[i, d]
 
     model.order_after_shipping = pyo.Constraint(
         model.ORDERS, model.DEMANDS,
@@ -97,19 +122,8 @@ def define_shipping_constraints(model):
         doc="If order not produced before demand, it completes after shipping"
     )
 
-    def ship_within_horizon_rule(m, d):
-        """
-        Each demand must ship within the planning horizon.
-
-        ship(d) ≤ T_max  ∀d
-        """
-        return m.ship[d] <= m.T_max_param
-
-    model.ship_within_horizon = pyo.Constraint(
-        model.DEMANDS,
-        rule=ship_within_horizon_rule,
-        doc="Shipping times within planning horizon"
-    )
+    # ship(d) ≤ T_max is the upper bound of the ship variable, so no row is
+    # added for it
 
     def ship_no_earlier_than_due_rule(m, d):
         """
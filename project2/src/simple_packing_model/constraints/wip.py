@@ -8,7 +8,9 @@ From Problem_3.pdf Page 7:
 - Shipped timing constraints
 """
 
+import numpy as np
 import pyomo.environ as pyo
+from pyomo.core.expr.numeric_expr import LinearExpression
 
 
 def define_wip_constraints(model):
@@ -18,8 +20,26 @@ def define_wip_constraints(model):
     Shipped timing:
     [shipped(d1,d) = 1] ⇒ [ship(d1) ≤ ship(d)]
     [shipped(d1,d) = 0] ⇒ [ship(d1) > ship(d)]
+
+    Row bodies are built as LinearExpression objects from coefficient and
+    variable lists, with the data read once into plain floats.
     """
 
+    # Plain Python lookups, read once instead of per rule call
+    qty = {d: float(model.qty[d]) for d in model.DEMANDS}
+    inv0 = {u: float(model.inv0[u]) for u in model.TYPES}
+    epsilon = float(model.epsilon)
+    big_m = float(model.M)
+    big_m_strict = big_m + epsilon
+
+    # Shipped-quantity coefficients of each type's demands, gathered once
+    # from the quantity vector; inventory_balance only drops demand d itself
+    qty_vector = np.array([qty[d] for d in model.DEMANDS])
+    type_coefs = {
+        u: list(zip(demands, qty_vector[np.asarray(demands, dtype=int) - 1].tolist()))
+        for u, demands in model.demands_of_type.items()
+    }
+
     def inventory_balance_rule(m, u, d):
         """
         Inventory balance: starting inventory + produced - shipped = remaining inventory.
@@ -33,15 +53,18 @@ def define_wip_constraints(model):
 
         The shipped(d1,d) binary variable indicates if demand d1 has shipped by the time
         demand d ships, so we only subtract the quantities that have actually been shipped.
+        Demand d itself has always shipped (shipped(d,d) = 1), so its quantity
+        is a constant when prodtype(d) = u.
         """
-        # Calculate shipped demand for type u by time demand d ships
-        shipped_demand = sum(
-            m.shipped[d1, d] * m.qty[d1]
-            for d1 in m.DEMANDS
-            if m.prodtype[d1] == u
+        # inv(u,d) - prodbefore(u,d) + ∑_{d1≠d} qty(d1) * shipped(d1,d) = inv0(u) - qty(d)
+        terms = [(d1, q) for d1, q in type_coefs[u] if d1 != d]
+        body = LinearExpression(
+            linear_coefs=[1.0, -1.0] + [q for _, q in terms],
+            linear_vars=[m.inv[u, d], m.prodbefore[u, d]] + [m.shipped[d1, d] for d1, _ in terms]
         )
+        rhs = inv0[u] - qty[d] if m.prodtype[d] == u else inv0[u]
 
-        return m.inv[u, d] == m.inv0[u] + m.prodbefore[u, d] - shipped_demand
+        return body == rhs
 
     model.inventory_balance = pyo.Constraint(
         model.TYPES, model.DEMANDS,
@@ -49,21 +72,8 @@ def define_wip_constraints(model):
         doc="Inventory balance equation for WIP tracking"
     )
 
-    def inventory_nonnegative_rule(m, u, d):
-        """
-        Inventory must be non-negative (feasibility constraint).
-
-        inv(u,d) ≥ 0  ∀u ∀d
-
-        This ensures we don't go into negative inventory.
-        """
-        return m.inv[u, d] >= 0
-
-    model.inventory_nonnegative = pyo.Constraint(
-        model.TYPES, model.DEMANDS,
-        rule=inventory_nonnegative_rule,
-        doc="Inventory must be non-negative"
-    )
+    # inv(u,d) ≥ 0 is enforced by the NonNegativeReals domain of model.inv
+    # (variables.py), so it needs no constraint row.
 
     def shipped_before_rule(m, d1, d):
         """
@@ -73,10 +83,14 @@ def define_wip_constraints(model):
 
         Reformulated as: ship(d1) ≤ ship(d) + M * (1 - shipped(d1,d))
         """
-        return m.ship[d1] <= m.ship[d] + m.M * (1 - m.shipped[d1, d])
+        body = LinearExpression(
+            linear_coefs=[1.0, -1.0, big_m],
+            linear_vars=[m.ship[d1], m.ship[d], m.shipped[d1, d]]
+        )
+        return body <= big_m
 
     model.shipped_before = pyo.Constraint(
-        model.DEMANDS, model.DEMANDS,
+        model.SHIP_PAIRS,
         rule=shipped_before_rule,
         doc="If shipped(d1,d)=1, then ship(d1) <= ship(d)"
     )
@@ -87,16 +101,40 @@ def define_wip_constraints(model):
 
         [shipped(d1,d) = 0] ⇒ [ship(d1) > ship(d)]
 
-        Reformulated as: ship(d1) ≥ ship(d) + epsilon - M * shipped(d1,d)
+        Reformulated as: ship(d1) ≥ ship(d) + epsilon - (M + epsilon) * shipped(d1,d)
 
         Note: We use epsilon to enforce strict inequality (ship(d1) > ship(d)).
         """
-        return m.ship[d1] >= m.ship[d] + m.epsilon - m.M * m.shipped[d1, d]
+        body = LinearExpression(
+            linear_coefs=[1.0, -1.0, big_m_strict],
+            linear_vars=[m.ship[d1], m.ship[d], m.shipped[d1, d]]
+        )
+        return body >= epsilon
 
     model.shipped_after = pyo.Constraint(
-        model.DEMANDS, model.DEMANDS,
+        model.SHIP_PAIRS,
         rule=shipped_after_rule,
         doc="If shipped(d1,d)=0, then ship(d1) > ship(d)"
     )
 
+    def shipped_order_rule(m, d1, d):
+        """
+        Of any two demands, at least one ships no later than the other.
+
+        shipped(d1,d) + shipped(d,d1) ≥ 1  ∀d1 < d
+
+        Not an equality: demands shipping at the same time have both set to 1.
+        """
+        body = LinearExpression(
+            linear_coefs=[1.0, 1.0],
+            linear_vars=[m.shipped[d1, d], m.shipped[d, d1]]
+        )
+        return body >= 1
+
+    model.shipped_order = pyo.Constraint(
+        model.DEMAND_PAIRS,
+        rule=shipped_order_rule,
+        doc="shipped(d1,d) + shipped(d,d1) >= 1 for d1 < d"
+    )
+
     return model
@@ -10,6 +10,7 @@ From Problem_3.pdf Page 8:
 """
 
 import pyomo.environ as pyo
+from pyomo.core.expr.numeric_expr import LinearExpression
 
 
 def define_workforce_constraints(model):
@@ -22,7 +23,14 @@ def define_workforce_constraints(model):
     3. Started tracking: [started(i,e) = 1] ⇒ [s(i) ≤ t(e)]
     4. Not complete tracking: [notcomplete(i,e) = 1] ⇒ [c(i) > t(e)]
     5. Max/min tracking: workersmax ≥ workersused(e), workersused(e) ≥ workersmin
-    6. Range: workforcerange = workersmax - workersmin
+    6. Range: workforcerange = workersmax - workersmin (used directly in the
+       objective, see ObjectiveManager._workforce_term)
+
+    3. and 4. are big-M rows with M = T_max. Modelling each (i, e) pair as
+    a pyomo.gdp Disjunction would add 2 * I^2 Disjunct blocks that gdp.bigm
+    turns back into the same rows for HiGHS; native indicator constraints
+    exist only on Gurobi/CPLEX, which solve() reaches through SolverFactory
+    and the LP/NL writers, where disjunctions are relaxed to big-M as well.
     """
 
     # First, we need to link event times to order start/completion times
@@ -58,13 +66,26 @@ def define_workforce_constraints(model):
     )
 
     # Active worker tracking (logical AND constraint)
+    # These are 2 * I^2 rows each, so the bodies are built directly as
+    # LinearExpression objects instead of through operator overloading.
+    #
+    # The upper bounds (1 and 2) are kept per (i, e). Aggregating them to
+    # workersused(e) ≤ ∑_i started(i,e) and ≤ ∑_i notcomplete(i,e) would
+    # only bound the count by min(#started, #notcomplete), not by the number
+    # of orders that are both. Since workersmin is pushed up by the
+    # workforce range term, the solver would use that slack to overstate
+    # workersused(e).
     def active_constraint_1_rule(m, i, e):
         """
         is_active(i,e) ≤ started(i,e)
 
         Part of: is_active(i,e) = started(i,e) ∧ notcomplete(i,e)
         """
-        return m.is_active[i, e] <= m.started[i, e]
+        body = LinearExpression(
+            linear_coefs=[1.0, -1.0],
+            linear_vars=[m.is_active[i, e], m.started[i, e]]
+        )
+        return body <= 0
 
     model.active_constraint_1 = pyo.Constraint(
         model.ORDERS, model.EVENTS,
@@ -78,7 +99,11 @@ def define_workforce_constraints(model):
 
         Part of: is_active(i,e) = started(i,e) ∧ notcomplete(i,e)
         """
-        return m.is_active[i, e] <= m.notcomplete[i, e]
+        body = LinearExpression(
+            linear_coefs=[1.0, -1.0],
+            linear_vars=[m.is_active[i, e], m.notcomplete[i, e]]
+        )
+        return body <= 0
 
     model.active_constraint_2 = pyo.Constraint(
         model.ORDERS, model.EVENTS,
@@ -93,7 +118,11 @@ def define_workforce_constraints(model):
         Part of: is_active(i,e) = started(i,e) ∧ notcomplete(i,e)
         This enforces: if both started and notcomplete are 1, then is_active must be 1.
         """
-        return m.is_active[i, e] >= m.started[i, e] + m.notcomplete[i, e] - 1
+        body = LinearExpression(
+            linear_coefs=[1.0, -1.0, -1.0],
+            linear_vars=[m.is_active[i, e], m.started[i, e], m.notcomplete[i, e]]
+        )
+        return body >= -1
 
     model.active_constraint_3 = pyo.Constraint(
         model.ORDERS, model.EVENTS,
@@ -107,7 +136,11 @@ def define_workforce_constraints(model):
         If started(i,e) = 1, then start(i) ≤ t(e)
 
         Reformulated as: start(i) ≤ t(e) + M * (1 - started(i,e))
+
+        Skipped for order i's own start event (started(i,i) is fixed to 1).
         """
+        if e == i:
+            return pyo.Constraint.Skip
         return m.start[i] <= m.t_event[e] + m.M * (1 - m.started[i, e])
 
     model.started_true = pyo.Constraint(
@@ -120,9 +153,13 @@ def define_workforce_constraints(model):
         """
         If started(i,e) = 0, then start(i) > t(e)
 
-        Reformulated as: start(i) ≥ t(e) + epsilon - M * started(i,e)
+        Reformulated as: start(i) ≥ t(e) + epsilon - (M + epsilon) * started(i,e)
+
+        Skipped for order i's own start event (started(i,i) is fixed to 1).
         """
-        return m.start[i] >= m.t_event[e] + m.epsilon - m.M * m.started[i, e]
+        if e == i:
+            return pyo.Constraint.Skip
+        return m.start[i] >= m.t_event[e] + m.epsilon - (m.M + m.epsilon) * m.started[i, e]
 
     model.started_false = pyo.Constraint(
         model.ORDERS, model.EVENTS,
@@ -135,9 +172,13 @@ def define_workforce_constraints(model):
         """
         If notcomplete(i,e) = 1, then complete(i) > t(e)
 
-        Reformulated as: complete(i) ≥ t(e) + epsilon - M * (1 - notcomplete(i,e))
+        Reformulated as: complete(i) ≥ t(e) + epsilon - (M + epsilon) * (1 - notcomplete(i,e))
+
+        Skipped for order i's own completion event (notcomplete(i,I+i) is fixed to 0).
         """
-        return m.complete[i] >= m.t_event[e] + m.epsilon - m.M * (1 - m.notcomplete[i, e])
+        if e == m.n_orders + i:
+            return pyo.Constraint.Skip
+        return m.complete[i] >= m.t_event[e] + m.epsilon - (m.M + m.epsilon) * (1 - m.notcomplete[i, e])
 
     model.notcomplete_true = pyo.Constraint(
         model.ORDERS, model.EVENTS,
@@ -150,7 +191,11 @@ def define_workforce_constraints(model):
         If notcomplete(i,e) = 0, then complete(i) ≤ t(e)
 
         Reformulated as: complete(i) ≤ t(e) + M * notcomplete(i,e)
+
+        Skipped for order i's own completion event (notcomplete(i,I+i) is fixed to 0).
         """
+        if e == m.n_orders + i:
+            return pyo.Constraint.Skip
         return m.complete[i] <= m.t_event[e] + m.M * m.notcomplete[i, e]
 
     model.notcomplete_false = pyo.Constraint(
@@ -159,6 +204,14 @@ def define_workforce_constraints(model):
         doc="If complete, then completion time before event time"
     )
 
+    # Fixed: An order has started at its own start event and is complete
+    # at its own completion event, since t(i) = start(i) and
+    # t(I+i) = complete(i). Fixing started(i,i) = 1 and notcomplete(i,I+i) = 0
+    # removes the columns at build time instead of adding rows for them.
+    for i in model.ORDERS:
+        model.started[i, i].fix(1)
+        model.notcomplete[i, model.n_orders + i].fix(0)
+
     # Workers used at each event
     def workers_used_rule(m, e):
         """
@@ -166,7 +219,12 @@ def define_workforce_constraints(model):
 
         workersused(e) = ∑_i is_active(i,e)  ∀e
         """
-        return m.workersused[e] == sum(m.is_active[i, e] for i in m.ORDERS)
+        # workersused(e) - ∑_i is_active(i,e) = 0
+        body = LinearExpression(
+            linear_coefs=[1.0] + [-1.0] * len(m.ORDERS),
+            linear_vars=[m.workersused[e]] + [m.is_active[i, e] for i in m.ORDERS]
+        )
+        return body == 0
 
     model.workers_used = pyo.Constraint(
         model.EVENTS,
@@ -181,7 +239,11 @@ def define_workforce_constraints(model):
 
         workersmax ≥ workersused(e)  ∀e
         """
-        return m.workersmax >= m.workersused[e]
+        body = LinearExpression(
+            linear_coefs=[1.0, -1.0],
+            linear_vars=[m.workersmax, m.workersused[e]]
+        )
+        return body >= 0
 
     model.max_workforce = pyo.Constraint(
         model.EVENTS,
@@ -196,7 +258,11 @@ def define_workforce_constraints(model):
 
         workersused(e) ≥ workersmin  ∀e
         """
-        return m.workersused[e] >= m.workersmin
+        body = LinearExpression(
+            linear_coefs=[1.0, -1.0],
+            linear_vars=[m.workersused[e], m.workersmin]
+        )
+        return body >= 0
 
     model.min_workforce = pyo.Constraint(
         model.EVENTS,
@@ -204,18 +270,4 @@ def define_workforce_constraints(model):
         doc="Minimum workforce tracking"
     )
 
-    # Workforce range
-    def workforce_range_rule(m):
-        """
-        Define workforce range as difference between max and min.
-
-        workforcerange = workersmax - workersmin
-        """
-        return m.workforcerange == m.workersmax - m.workersmin
-
-    model.workforce_range = pyo.Constraint(
-        rule=workforce_range_rule,
-        doc="Workforce range definition"
-    )
-
     return model
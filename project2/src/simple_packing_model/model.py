@@ -7,8 +7,11 @@ Implements the complete MILP model from Problem_3.pdf with:
 - Setup times and demand fulfillment
 """
 
+import warnings
+
 import pyomo.environ as pyo
 from pyomo.opt import SolverFactory, TerminationCondition
+from pyomo.contrib.appsi.solvers import Highs
 import numpy as np
 
 from .parameters import define_parameters
@@ -22,6 +25,27 @@ from .constraints import (
     define_otif_constraints
 )
 from .objective import define_objective
+from .warmstart import generate_initial_schedule, apply_initial_schedule
+
+
+# HiGHS model status -> termination condition name, as reported by the
+# appsi_highs path (same mapping as pyomo.contrib.appsi.solvers.Highs)
+_HIGHS_TERMINATION = {
+    'kOptimal': 'optimal',
+    'kInfeasible': 'infeasible',
+    'kUnboundedOrInfeasible': 'infeasibleOrUnbounded',
+    'kUnbounded': 'unbounded',
+    'kObjectiveBound': 'objectiveLimit',
+    'kObjectiveTarget': 'objectiveLimit',
+    'kTimeLimit': 'maxTimeLimit',
+    'kIterationLimit': 'maxIterations',
+    'kSolutionLimit': 'maxIterations',
+    'kLoadError': 'error',
+    'kModelError': 'error',
+    'kPresolveError': 'error',
+    'kSolveError': 'error',
+    'kPostsolveError': 'error',
+}
 
 
 class PackingScheduleModelProblem3:
@@ -41,7 +65,7 @@ class PackingScheduleModelProblem3:
     - No time discretization
     """
 
-    def __init__(self, data):
+    def __init__(self, data, apply_presolve=False):
         """
         Initialize the Problem_3 packing schedule model.
 
@@ -61,13 +85,26 @@ class PackingScheduleModelProblem3:
                 - demand_qty: Array[n_demands] - qty(d)
                 - priority: Array[n_orders] - priority(i)
                 - objective_weights: Dict with beta, gamma, delta
+            apply_presolve: Run tighten_bounds() once the model is built
         """
         self.data = data
         self.model = pyo.ConcreteModel(name="PackingSchedule_Problem3")
 
+        # Heuristic schedule from generate_initial_schedule(), built on the
+        # first set_heuristic_start() call (False if none fits the horizon)
+        self._initial_schedule = None
+
+        # APPSI HiGHS instance from the last appsi_highs solve, with the
+        # settings it was configured for (see _solve_highs)
+        self._solver = None
+        self._solver_settings = None
+
         # Build the model
         self._build_model()
 
+        if apply_presolve:
+            self.tighten_bounds()
+
     def _build_model(self):
         """Build the complete optimization model."""
         # Define parameters and sets
@@ -87,16 +124,71 @@ class PackingScheduleModelProblem3:
         # Define objective function
         define_objective(self.model, self.data)
 
-    def solve(self, solver_name='appsi_highs', tee=True, time_limit=None, mip_rel_gap=None, highs_options=None):
+    def tighten_bounds(self, max_iter=10, verbose=False):
+        """
+        Tighten variable bounds with feasibility-based bound tightening (FBBT).
+
+        Bounds implied by the constraints (e.g. is_active(i,I+i) = 0 from
+        the fixed notcomplete(i,I+i), or ship time windows from due dates)
+        are written onto the variables, which
+        tightens the LP relaxation the solver starts from.
+
+        Args:
+            max_iter: Maximum number of FBBT passes over the constraints
+            verbose: Print every variable whose bounds changed
+
+        Returns:
+            Dictionary {variable name: ((old lb, old ub), (new lb, new ub))}
+        """
+        from pyomo.contrib.fbbt.fbbt import fbbt
+
+        variables = list(self.model.component_data_objects(pyo.Var, active=True))
+        before = [(v.lb, v.ub) for v in variables]
+
+        fbbt(self.model, max_iter=max_iter, improvement_tol=1e-4)
+
+        changes = {
+            v.name: (old, (v.lb, v.ub))
+            for v, old in zip(variables, before)
+            if old != (v.lb, v.ub)
+        }
+        if verbose:
+            for name, (old, new) in changes.items():
+                print(f"  {name}: [{old[0]}, {old[1]}] -> [{new[0]}, {new[1]}]")
+
+        return changes
+
+    def solve(self, solver_name='appsi_highs', tee=True, time_limit=None, mip_rel_gap=None, highs_options=None,
+              warmstart=False, threads=None, persistent=False, presolve=None, mip_heuristic_effort=None):
         """
         Solve the optimization model.
 
         Args:
-            solver_name: Name of the solver ('appsi_highs', 'glpk', 'gurobi', etc.)
+            solver_name: Name of the solver ('appsi_highs', 'highspy', 'glpk', 'gurobi', etc.)
+                'highspy' passes the matrix built by export_to_highspy() straight
+                to HiGHS without any Pyomo solver interface
             tee: Whether to stream solver output
-            time_limit: Time limit in seconds (None for no limit)
-            mip_rel_gap: Relative MIP gap tolerance (None for default)
+            time_limit: Time limit in seconds (None falls back to
+                data['time_limit'], or no limit if that is not set)
+            mip_rel_gap: Relative MIP gap tolerance (None falls back to
+                data['mip_rel_gap'], or the solver default)
             highs_options: Dictionary of additional HiGHS-specific options
+            warmstart: Pass the current variable values to the solver as a MIP
+                start (e.g. values set by a heuristic before calling solve).
+                Solvers that cannot take a start (e.g. glpk) solve without it
+                and a warning is issued
+            threads: Number of solver threads (None for the solver default).
+                For HiGHS this also switches on parallel mode
+            persistent: For 'gurobi' and 'cplex', use the Pyomo persistent
+                interface ('gurobi_persistent'/'cplex_persistent'), which
+                passes the model through the solver API instead of writing
+                an LP file
+            presolve: HiGHS only. True/False switches presolve on/off (None
+                for the HiGHS default, 'choose')
+            mip_heuristic_effort: HiGHS only. Share of MIP effort spent on
+                primal heuristics, in [0, 1] (None for the HiGHS default,
+                0.05). Raising it finds good incumbents earlier, which pays
+                off together with a loose mip_rel_gap
 
         Returns:
             Dictionary with results:
@@ -104,45 +196,87 @@ class PackingScheduleModelProblem3:
                 - objective_value: Optimal objective value (or None)
                 - solve_time: Solution time in seconds
         """
+        if time_limit is None:
+            time_limit = self.data.get('time_limit')
+        if mip_rel_gap is None:
+            mip_rel_gap = self.data.get('mip_rel_gap')
+
+        if solver_name in ('appsi_highs', 'highspy'):
+            # First-class HiGHS settings; explicit highs_options entries win
+            tuning = {}
+            if threads is not None:
+                tuning.update(threads=int(threads), parallel='on')
+            if presolve is not None:
+                tuning['presolve'] = 'on' if presolve else 'off'
+            if mip_heuristic_effort is not None:
+                tuning['mip_heuristic_effort'] = float(mip_heuristic_effort)
+            if tuning:
+                highs_options = {**tuning, **(highs_options or {})}
+
+        if solver_name == 'appsi_highs':
+            return self._solve_highs(tee, time_limit, mip_rel_gap, highs_options, warmstart)
+        if solver_name == 'highspy':
+            return self._solve_highspy(tee, time_limit, mip_rel_gap, highs_options, warmstart)
+
         # Create solver
-        solver = pyo.SolverFactory(solver_name)
+        persistent = persistent and solver_name in ('gurobi', 'cplex')
+        if persistent:
+            solver = pyo.SolverFactory(f'{solver_name}_persistent')
+            solver.set_instance(self.model, symbolic_solver_labels=False)
+        else:
+            solver = pyo.SolverFactory(solver_name)
 
         # Set solver options
         if time_limit is not None:
-            if solver_name == 'appsi_highs':
-                solver.config.time_limit = time_limit
-            elif solver_name in ['gurobi', 'cplex']:
+            if solver_name in ['gurobi', 'cplex']:
                 solver.options['timelimit'] = time_limit
+            elif solver_name == 'cbc':
+                solver.options['seconds'] = time_limit
+            elif solver_name == 'glpk':
+                solver.options['tmlim'] = int(time_limit)
+
+        if threads is not None:
+            if solver_name in ['gurobi', 'cplex']:
+                solver.options['threads'] = int(threads)
 
         if mip_rel_gap is not None:
-            if solver_name == 'appsi_highs':
-                solver.config.mip_gap = mip_rel_gap
-            elif solver_name == 'gurobi':
+            if solver_name == 'gurobi':
                 solver.options['MIPGap'] = mip_rel_gap
             elif solver_name == 'cplex':
                 solver.options['mipgap'] = mip_rel_gap
+            elif solver_name == 'cbc':
+                solver.options['ratioGap'] = mip_rel_gap
+            elif solver_name == 'glpk':
+                solver.options['mipgap'] = mip_rel_gap
 
-        # Apply HiGHS-specific performance options
-        if solver_name == 'appsi_highs' and highs_options:
-            for key, value in highs_options.items():
-                solver.highs_options[key] = value
-
-        # Solve the model
-        if solver_name == 'appsi_highs':
-            solver.config.load_solution = False  # Don't auto-load if infeasible
-            results = solver.solve(self.model, tee=tee)
+        # Solve the model. Only solvers that can take a MIP start accept the
+        # warmstart keyword; for the others (e.g. glpk) it would reach the LP
+        # writer and fail, so the start is dropped with a warning
+        solve_kwargs = {}
+        if warmstart:
+            if solver.warm_start_capable():
+                solve_kwargs['warmstart'] = True
+            else:
+                warnings.warn(
+                    f"Solver '{solver_name}' does not support warm starts; "
+                    f"solving without the start values"
+                )
+        if persistent:
+            results = solver.solve(tee=tee, load_solutions=False, **solve_kwargs)
         else:
-            results = solver.solve(self.model, tee=tee, load_solutions=False)
+            results = solver.solve(
+                self.model, tee=tee, load_solutions=False, symbolic_solver_labels=False,
+                **solve_kwargs
+            )
 
         # Extract results
         termination = results.solver.termination_condition
 
         # Load solution if optimal or feasible
-        if solver_name == 'appsi_highs':
-            if termination in [TerminationCondition.optimal, TerminationCondition.feasible]:
+        if termination in [TerminationCondition.optimal, TerminationCondition.feasible]:
+            if persistent:
                 solver.load_vars()
-        else:
-            if termination in [TerminationCondition.optimal, TerminationCondition.feasible]:
+            else:
                 self.model.solutions.load_from(results)
 
         result_dict = {
@@ -155,6 +289,296 @@ class PackingScheduleModelProblem3:
 
         return result_dict
 
+    def set_heuristic_start(self):
+        """
+        Set a greedy inventory-first schedule as the variables' starting values.
+
+        See warmstart.generate_initial_schedule(). Pass the return value as
+        solve(warmstart=...) so the solver only gets a MIP start when one
+        was set.
+
+        The schedule depends only on the problem data, not on the objective
+        weights, so it is built once per model and reused by later calls
+        (e.g. between set_objective_weights() re-solves).
+
+        Returns:
+            True if a schedule within the horizon was found and set, else False
+        """
+        if self._initial_schedule is None:
+            schedule = generate_initial_schedule(self.data, pyo.value(self.model.epsilon))
+            # False records that no schedule fits, so the search is not repeated
+            self._initial_schedule = schedule if schedule is not None else False
+        if self._initial_schedule is False:
+            return False
+        apply_initial_schedule(self.model, self.data, self._initial_schedule)
+        return True
+
+    def set_start_from_model(self, previous):
+        """
+        Set the solution of another solved model as this model's starting values.
+
+        Meant for scenario sweeps where only numeric data changes (due
+        dates, quantities, processing or setup times): the previous line
+        assignment and start times are kept, completion times are
+        recomputed from this model's processing times, and each demand
+        ships at the later of its previous ship time and its new due date.
+        Every other variable is derived from that schedule as in
+        set_heuristic_start(). The start need not be feasible for the new
+        data; the solver repairs or discards it. Call solve(warmstart=True)
+        afterwards.
+
+        Args:
+            previous: Solved PackingScheduleModelProblem3 with the same
+                numbers of types, orders, demands and lines
+
+        Raises:
+            ValueError: If the two models differ in any of those dimensions
+        """
+        for key in ('n_unique_types', 'n_orders', 'n_demands', 'n_lines'):
+            if int(previous.data[key]) != int(self.data[key]):
+                raise ValueError(f"'{key}' differs from the previous model; the start cannot be reused")
+
+        prev = previous.get_solution()
+        T_max = float(self.data['T_max'])
+        order_type = np.asarray(self.data['order_type'])
+        processing_time = np.asarray(self.data['processing_time'], dtype=float)
+
+        # Unassigned orders sit at the end of the horizon with zero duration,
+        # as in generate_initial_schedule()
+        line = np.zeros(len(order_type), dtype=int)
+        start = np.full(len(order_type), T_max)
+        orders = prev['assignment_arrays']['order'] - 1
+        line[orders] = prev['assignment_arrays']['line']
+        start[orders] = prev['assignment_arrays']['start']
+        complete = start.copy()
+        complete[orders] += processing_time[order_type[orders] - 1, line[orders] - 1]
+
+        ship = np.maximum(
+            prev['demand_arrays']['ship_time'],
+            np.asarray(self.data['due_date'], dtype=float)
+        )
+        schedule = {'line': line, 'start': start, 'complete': complete, 'ship': ship}
+        apply_initial_schedule(self.model, self.data, schedule)
+
+    def set_objective_weights(self, alpha=None, beta=None, gamma=None, delta=None):
+        """
+        Change objective weights on the built model.
+
+        The weights are mutable Params, so the objective expression is not
+        rebuilt. To re-solve from the previous solution after a change, call
+        solve(warmstart=True).
+
+        Args:
+            alpha: OTIF weight (None keeps the current value)
+            beta: WIP weight (None keeps the current value)
+            gamma: Workforce weight (None keeps the current value)
+            delta: Not utilized weight (None keeps the current value)
+        """
+        m = self.model
+        weights = {'alpha': alpha, 'beta': beta, 'gamma': gamma, 'delta': delta}
+        for name, value in weights.items():
+            if value is not None:
+                m.component(name).set_value(float(value))
+
+    def _solve_highs(self, tee, time_limit, mip_rel_gap, highs_options, warmstart=False):
+        """
+        Solve the model through the APPSI HiGHS interface directly.
+
+        The model is pushed to HiGHS with set_instance() instead of going
+        through the SolverFactory wrapper, so no intermediate legacy results
+        object or symbolic labels are built. The instance is kept for the
+        next call with the same settings, so re-solving after e.g.
+        set_objective_weights() only sends the changed coefficients.
+
+        Args:
+            tee: Whether to stream solver output
+            time_limit: Time limit in seconds (None for no limit)
+            mip_rel_gap: Relative MIP gap tolerance (None for default)
+            highs_options: Dictionary of additional HiGHS-specific options
+            warmstart: Hand the current variable values to HiGHS as a MIP start
+
+        Returns:
+            Dictionary with results (same keys as solve())
+        """
+        # HiGHS keeps options once set, so the instance is only reused while
+        # the settings match; a reused instance picks up changed mutable
+        # Params (the objective weights) and bounds through APPSI's
+        # incremental update instead of rebuilding the HiGHS model
+        settings = (time_limit, mip_rel_gap, tuple(sorted((highs_options or {}).items())))
+        if self._solver is None or self._solver_settings != settings:
+            solver = Highs()
+            solver.config.symbolic_solver_labels = False
+            solver.config.load_solution = False  # Don't auto-load if infeasible
+            if time_limit is not None:
+                solver.config.time_limit = time_limit
+            if mip_rel_gap is not None:
+                solver.config.mip_gap = mip_rel_gap
+
+            # Apply HiGHS-specific performance options
+            if highs_options:
+                for key, value in highs_options.items():
+                    solver.highs_options[key] = value
+
+            solver.set_instance(self.model)
+            self._solver = solver
+            self._solver_settings = settings
+        solver = self._solver
+        solver.config.stream_solver = tee
+        solver.config.warmstart = warmstart
+
+        results = solver.solve(self.model)
+
+        # Load the incumbent whenever one exists (optimal or stopped at a limit)
+        has_solution = results.best_feasible_objective is not None
+        if has_solution:
+            results.solution_loader.load_vars()
+
+        return {
+            'status': results.termination_condition.name,
+            'objective_value': pyo.value(self.model.objective) if has_solution else None,
+            'solve_time': results.wallclock_time
+        }
+
+    def export_to_highspy(self):
+        """
+        Build the model directly as a highspy.Highs instance.
+
+        Variables are collected once via component_data_objects() into
+        column bound/integrality arrays, and every constraint body is turned
+        into one CSR row. The arrays are passed to HiGHS as one HighsLp via
+        passModel(), so the model reaches HiGHS without an LP file, a Pyomo
+        solver interface or incremental column/row updates in between.
+
+        Returns:
+            Tuple (highs, variables): the loaded highspy.Highs object and the
+            list of Pyomo VarData objects in column order
+        """
+        import highspy
+        from pyomo.repn import generate_standard_repn
+
+        m = self.model
+
+        variables = list(m.component_data_objects(pyo.Var, active=True))
+        column = {id(v): k for k, v in enumerate(variables)}
+        n_cols = len(variables)
+
+        col_lower = np.empty(n_cols)
+        col_upper = np.empty(n_cols)
+        integrality = np.zeros(n_cols, dtype=np.int32)
+        for k, v in enumerate(variables):
+            if v.fixed:
+                col_lower[k] = col_upper[k] = v.value
+            else:
+                col_lower[k] = -highspy.kHighsInf if v.lb is None else v.lb
+                col_upper[k] = highspy.kHighsInf if v.ub is None else v.ub
+            if v.is_integer():
+                integrality[k] = 1
+
+        # Objective (the model minimizes)
+        obj_repn = generate_standard_repn(m.objective.expr, quadratic=False)
+        costs = np.zeros(n_cols)
+        for v, coef in zip(obj_repn.linear_vars, obj_repn.linear_coefs):
+            costs[column[id(v)]] += coef
+
+        # Constraints as CSR rows: lower <= body - constant <= upper
+        row_lower, row_upper = [], []
+        starts, indices, values = [], [], []
+        for con in m.component_data_objects(pyo.Constraint, active=True):
+            repn = generate_standard_repn(con.body, quadratic=False)
+            if not repn.linear_vars:
+                continue
+            starts.append(len(indices))
+            for v, coef in zip(repn.linear_vars, repn.linear_coefs):
+                indices.append(column[id(v)])
+                values.append(coef)
+            constant = pyo.value(repn.constant)
+            lower = pyo.value(con.lower)
+            upper = pyo.value(con.upper)
+            row_lower.append(-highspy.kHighsInf if lower is None else lower - constant)
+            row_upper.append(highspy.kHighsInf if upper is None else upper - constant)
+
+        # Hand the whole model to HiGHS in a single passModel() call
+        starts.append(len(indices))
+        lp = highspy.HighsLp()
+        lp.num_col_ = n_cols
+        lp.num_row_ = len(row_lower)
+        lp.col_cost_ = costs
+        lp.col_lower_ = col_lower
+        lp.col_upper_ = col_upper
+        lp.row_lower_ = np.array(row_lower)
+        lp.row_upper_ = np.array(row_upper)
+        lp.offset_ = float(pyo.value(obj_repn.constant))
+        lp.a_matrix_.format_ = highspy.MatrixFormat.kRowwise
+        lp.a_matrix_.num_col_ = n_cols
+        lp.a_matrix_.num_row_ = len(row_lower)
+        lp.a_matrix_.start_ = np.array(starts, dtype=np.int32)
+        lp.a_matrix_.index_ = np.array(indices, dtype=np.int32)
+        lp.a_matrix_.value_ = np.array(values)
+        lp.integrality_ = [
+            highspy.HighsVarType.kInteger if flag else highspy.HighsVarType.kContinuous
+            for flag in integrality
+        ]
+
+        highs = highspy.Highs()
+        highs.setOptionValue('output_flag', False)
+        highs.passModel(lp)
+
+        return highs, variables
+
+    def _solve_highspy(self, tee, time_limit, mip_rel_gap, highs_options, warmstart=False):
+        """
+        Solve the model built by export_to_highspy() and load the values back.
+
+        The status is reported with the same termination condition names as
+        the appsi_highs path (e.g. 'optimal', 'maxTimeLimit').
+
+        Args:
+            tee: Whether to stream solver output
+            time_limit: Time limit in seconds (None for no limit)
+            mip_rel_gap: Relative MIP gap tolerance (None for default)
+            highs_options: Dictionary of additional HiGHS-specific options
+            warmstart: Hand the current variable values to HiGHS as a MIP
+                start via setSolution() (variables without a value start at 0)
+
+        Returns:
+            Dictionary with results (same keys as solve())
+        """
+        import highspy
+
+        highs, variables = self.export_to_highspy()
+        highs.setOptionValue('output_flag', tee)
+        if time_limit is not None:
+            highs.setOptionValue('time_limit', float(time_limit))
+        if mip_rel_gap is not None:
+            highs.setOptionValue('mip_rel_gap', float(mip_rel_gap))
+        if highs_options:
+            for key, value in highs_options.items():
+                highs.setOptionValue(key, value)
+
+        if warmstart:
+            col_value = np.array([0.0 if v.value is None else v.value for v in variables])
+            solution = highspy.HighsSolution()
+            solution.col_value = col_value
+            solution.value_valid = True
+            solution.dual_valid = False
+            highs.setSolution(solution)
+
+        highs.run()
+
+        status = highs.getModelStatus()
+        has_solution = highs.getInfo().primal_solution_status == highspy.SolutionStatus.kSolutionStatusFeasible
+        if has_solution:
+            col_value = highs.getSolution().col_value
+            for v, val in zip(variables, col_value):
+                if not v.fixed:
+                    v.set_value(val, skip_validation=True)
+
+        return {
+            'status': _HIGHS_TERMINATION.get(status.name, 'unknown'),
+            'objective_value': pyo.value(self.model.objective) if has_solution else None,
+            'solve_time': highs.getRunTime()
+        }
+
     def get_solution(self):
         """
         Extract the solution from the solved model.
@@ -162,93 +586,134 @@ class PackingScheduleModelProblem3:
         Returns:
             Dictionary with solution details:
                 - assignments: List of order assignments
+                - assignment_arrays: The same assignments as numpy arrays
+                  (keys order, line, type, start, completion)
                 - demands: Demand fulfillment details
+                - demand_arrays: The same demands as numpy arrays (keys
+                  demand, type, quantity, due_date, ship_time)
                 - inventory: Inventory levels per type and demand
                 - workforce: Workforce utilization at events
                 - events: Event times (start and completion)
+                - shipped: Sorted demands shipped before or with each demand
+                - shipped_matrix: The same as a 0/1 array, [d1 - 1, d - 1]
+                  is 1 if d1 shipped before or with d (diagonal included)
         """
         m = self.model
-
-        # Extract order assignments
-        assignments = []
-        for i in m.ORDERS:
-            for j in m.LINES:
-                if pyo.value(m.x[i, j]) > 0.5:  # Binary variable is 1
-                    assignments.append({
-                        'order': i,
-                        'line': j,
-                        'type': int(m.order_type[i]),
-                        'start': float(pyo.value(m.start[i])),
-                        'completion': float(pyo.value(m.complete[i])),
-                        'duration': float(pyo.value(m.complete[i]) - pyo.value(m.start[i]))
-                    })
-
-        # Extract demand fulfillment
-        demands = []
-        for d in m.DEMANDS:
-            demands.append({
-                'demand': d,
-                'type': int(m.prodtype[d]),
-                'quantity': int(m.qty[d]),
-                'due_date': float(m.due[d]),
-                'ship_time': float(pyo.value(m.ship[d]))
-            })
+        n_orders, n_lines = len(m.ORDERS), len(m.LINES)
+        n_types, n_demands = len(m.TYPES), len(m.DEMANDS)
+
+        # Variable values are read through .value (a plain attribute) rather
+        # than pyo.value(), and the indexed ones are pulled into numpy arrays
+        # in one pass each; m.x and m.inv are dense, in index order.
+        def values(var, count):
+            return np.fromiter((v.value for v in var.values()), dtype=float, count=count)
+
+        # Extract order assignments, column-wise first: one array entry per
+        # scheduled order, in order/line index order
+        x_value = values(m.x, n_orders * n_lines).reshape(n_orders, n_lines)
+        order_idx, line_idx = np.nonzero(x_value > 0.5)  # Binary variable is 1
+        start_value = values(m.start, n_orders)
+        complete_value = values(m.complete, n_orders)
+        order_type = np.array([m.order_type[i] for i in m.ORDERS], dtype=int)
+        assignment_arrays = {
+            'order': order_idx + 1,
+            'line': line_idx + 1,
+            'type': order_type[order_idx],
+            'start': start_value[order_idx],
+            'completion': complete_value[order_idx],
+        }
+        assignments = [
+            {
+                'order': int(order),
+                'line': int(line),
+                'type': int(order_type_i),
+                'start': float(start),
+                'completion': float(completion),
+                'duration': float(completion - start)
+            }
+            for order, line, order_type_i, start, completion in zip(
+                assignment_arrays['order'], assignment_arrays['line'],
+                assignment_arrays['type'], assignment_arrays['start'],
+                assignment_arrays['completion']
+            )
+        ]
+
+        # Extract demand fulfillment (arrays indexed by demand - 1)
+        demand_arrays = {
+            'demand': np.arange(1, m.n_demands + 1),
+            'type': np.array([m.prodtype[d] for d in m.DEMANDS], dtype=int),
+            'quantity': np.array([m.qty[d] for d in m.DEMANDS], dtype=int),
+            'due_date': np.array([m.due[d] for d in m.DEMANDS], dtype=float),
+            'ship_time': values(m.ship, n_demands),
+        }
+        demands = [
+            {
+                'demand': int(demand),
+                'type': int(prod_type),
+                'quantity': int(quantity),
+                'due_date': float(due_date),
+                'ship_time': float(ship_time)
+            }
+            for demand, prod_type, quantity, due_date, ship_time in zip(
+                demand_arrays['demand'], demand_arrays['type'],
+                demand_arrays['quantity'], demand_arrays['due_date'],
+                demand_arrays['ship_time']
+            )
+        ]
 
         # Extract inventory levels
-        inventory = {}
-        for u in m.TYPES:
-            inventory[u] = {
-                d: int(pyo.value(m.inv[u, d]))
-                for d in m.DEMANDS
-            }
+        inv_value = np.rint(values(m.inv, n_types * n_demands)).astype(int).reshape(n_types, n_demands)
+        inventory = {
+            u: dict(zip(m.DEMANDS, inv_value[u_idx].tolist()))
+            for u_idx, u in enumerate(m.TYPES)
+        }
 
         # Extract workforce utilization at events
-        workforce_events = {
-            e: float(pyo.value(m.workersused[e]))
-            for e in m.EVENTS
-        }
+        workforce_events = {e: float(v.value) for e, v in m.workersused.items()}
 
         workforce_summary = {
-            'max': float(pyo.value(m.workersmax)),
-            'min': float(pyo.value(m.workersmin)),
-            'range': float(pyo.value(m.workforcerange))
+            'max': float(m.workersmax.value),
+            'min': float(m.workersmin.value),
+            'range': float(m.workersmax.value - m.workersmin.value)
         }
 
         # Extract event times
-        event_times = {
-            e: float(pyo.value(m.t_event[e]))
-            for e in m.EVENTS
-        }
+        event_times = {e: float(v.value) for e, v in m.t_event.items()}
 
         # Extract shipped variable (d1, d) - which demands shipped before/with each demand
-        shipped = {}
-        for d in m.DEMANDS:
-            shipped[d] = []
-            for d1 in m.DEMANDS:
-                if pyo.value(m.shipped[d1, d]) > 0.5:  # Binary variable is 1
-                    shipped[d].append(d1)
+        # One pass over extract_values() into a matrix indexed [d1 - 1, d - 1];
+        # the diagonal has no variable and counts as shipped by definition
+        shipped_matrix = np.eye(n_demands, dtype=int)
+        for (d1, d), value in m.shipped.extract_values().items():
+            if value > 0.5:  # Binary variable is 1
+                shipped_matrix[d1 - 1, d - 1] = 1
+        shipped = {
+            d: (np.flatnonzero(shipped_matrix[:, d - 1]) + 1).tolist()
+            for d in m.DEMANDS
+        }
 
         # Extract OTIF variables
-        otif_data = {}
-        for d in m.DEMANDS:
-            otif_data[d] = {
-                'lateness': float(pyo.value(m.lateness[d])),
-                'late': int(pyo.value(m.late[d]))
-            }
+        lateness = values(m.lateness, n_demands).tolist()
+        late = np.rint(values(m.late, n_demands)).astype(int).tolist()
+        otif_data = {
+            d: {'lateness': lateness_d, 'late': late_d}
+            for d, lateness_d, late_d in zip(m.DEMANDS, lateness, late)
+        }
 
         # Extract line utilization
-        line_utilization = {}
-        for j in m.LINES:
-            line_utilization[j] = int(pyo.value(m.u[j]))
+        line_utilization = {j: int(round(v.value)) for j, v in m.u.items()}
 
         return {
             'assignments': assignments,
+            'assignment_arrays': assignment_arrays,
             'demands': demands,
+            'demand_arrays': demand_arrays,
             'inventory': inventory,
             'workforce_events': workforce_events,
             'workforce_summary': workforce_summary,
             'event_times': event_times,
             'shipped': shipped,
+            'shipped_matrix': shipped_matrix,
             'otif': otif_data,
             'line_utilization': line_utilization
         }
@@ -346,11 +811,11 @@ class PackingScheduleModelProblem3:
         print(header)
         print("  " + "-" * len(header))
 
-        # Rows
+        # Rows, from shipped(d1, d) as a matrix with the diagonal set
+        shipped_mat = solution['shipped_matrix']
         for d1 in m.DEMANDS:
             row = f"  d1={d1:>2} |"
-            for d in m.DEMANDS:
-                val = int(pyo.value(m.shipped[d1, d]))
+            for val in shipped_mat[d1-1]:
                 row += f"  {val}   |"
             print(row)
 
@@ -358,7 +823,7 @@ class PackingScheduleModelProblem3:
         print(f"\nDemands Shipped Before/With Each Demand:")
         for d in m.DEMANDS:
             shipped_with = solution['shipped'][d]
-            ship_time = next(dem['ship_time'] for dem in solution['demands'] if dem['demand'] == d)
+            ship_time = solution['demand_arrays']['ship_time'][d-1]
             print(f"  Demand {d} (ship={ship_time:.2f}): {sorted(shipped_with)}")
 
         print("="*80)
@@ -384,6 +849,11 @@ class PackingScheduleModelProblem3:
             print(f"  Demand {demand['demand']}: type={demand['type']}, qty={demand['quantity']}, "
                   f"due={demand['due_date']:.2f}, ship={demand['ship_time']:.2f}")
 
+        # prodbefore(u,d) rounded, one list per type
+        prod_before = {
+            u: [round(m.prodbefore[u, d].value) for d in m.DEMANDS] for u in m.TYPES
+        }
+
         # Print the inventory matrix for each type
         for u in m.TYPES:
             print(f"\n--- Type {u} Inventory ---")
@@ -399,36 +869,39 @@ class PackingScheduleModelProblem3:
             # Inventory row
             row = f"  inv({u},d) |"
             for d in m.DEMANDS:
-                val = int(pyo.value(m.inv[u, d]))
+                val = solution['inventory'][u][d]
                 row += f" {val:>6} |"
             print(row)
 
             # Production before row
             row = f"  prod(u,d) |"
-            for d in m.DEMANDS:
-                val = int(pyo.value(m.prodbefore[u, d]))
+            for val in prod_before[u]:
                 row += f" {val:>6} |"
             print(row)
 
+        # Quantity of each type shipped before or with each demand:
+        # shipped_qty[u, d] = ∑_d1 [prodtype(d1) = u] * qty(d1) * shipped(d1, d),
+        # one matrix product instead of a loop over d1 per (u, d)
+        demand_arrays = solution['demand_arrays']
+        shipped_mat = solution['shipped_matrix']
+        type_qty = np.array([
+            (demand_arrays['type'] == u) * demand_arrays['quantity'] for u in m.TYPES
+        ])
+        shipped_qty = type_qty @ shipped_mat
+
         # Show inventory trajectory for each type
         print(f"\nInventory Trajectory (by ship time):")
-        for u in m.TYPES:
+        for u_idx, u in enumerate(m.TYPES):
             print(f"\n  Type {u}:")
             print(f"    Initial: {int(m.inv0[u])} units")
 
             for demand in demands_sorted:
                 d = demand['demand']
-                inv_level = int(pyo.value(m.inv[u, d]))
-                prod_before = int(pyo.value(m.prodbefore[u, d]))
-
-                # Calculate what was shipped of this type by time d
-                shipped_of_type = 0
-                for d1 in m.DEMANDS:
-                    if m.prodtype[d1] == u and pyo.value(m.shipped[d1, d]) > 0.5:
-                        shipped_of_type += int(m.qty[d1])
+                inv_level = solution['inventory'][u][d]
+                shipped_of_type = int(shipped_qty[u_idx, d - 1])
 
                 print(f"    After demand {d} ships (t={demand['ship_time']:.2f}): "
-                      f"inv={inv_level}, produced_before={prod_before}, shipped_so_far={shipped_of_type}")
+                      f"inv={inv_level}, produced_before={prod_before[u][d-1]}, shipped_so_far={shipped_of_type}")
 
         print("="*80)
 
@@ -445,24 +918,28 @@ class PackingScheduleModelProblem3:
         print("ASSIGNMENT MATRIX: x(i, j) = 1 means order i assigned to line j")
         print("="*80)
 
+        # x(i,j), line, start and completion per order as arrays, built once
+        # from the solution instead of one Pyomo lookup per cell
+        arrays = solution['assignment_arrays']
+        order_idx = arrays['order'] - 1
+        x_mat = np.zeros((m.n_orders, len(m.LINES)), dtype=int)
+        x_mat[order_idx, arrays['line'] - 1] = 1
+        assigned_line = np.zeros(m.n_orders, dtype=int)
+        assigned_line[order_idx] = arrays['line']
+        start_time = np.zeros(m.n_orders)
+        start_time[order_idx] = arrays['start']
+        complete_time = np.zeros(m.n_orders)
+        complete_time[order_idx] = arrays['completion']
+        order_type = np.array([m.order_type[i] for i in m.ORDERS], dtype=int)
+
         # Get order information
         print(f"\nOrder Information:")
         for i in m.ORDERS:
-            order_type = int(m.order_type[i])
-            # Find which line this order is assigned to
-            assigned_line = None
-            for j in m.LINES:
-                if pyo.value(m.x[i, j]) > 0.5:
-                    assigned_line = j
-                    break
-
-            if assigned_line is not None:
-                start_time = pyo.value(m.start[i])
-                complete_time = pyo.value(m.complete[i])
-                print(f"  Order {i}: type={order_type}, line={assigned_line}, "
-                      f"start={start_time:.2f}, complete={complete_time:.2f}")
+            if assigned_line[i-1]:
+                print(f"  Order {i}: type={order_type[i-1]}, line={assigned_line[i-1]}, "
+                      f"start={start_time[i-1]:.2f}, complete={complete_time[i-1]:.2f}")
             else:
-                print(f"  Order {i}: type={order_type}, NOT ASSIGNED")
+                print(f"  Order {i}: type={order_type[i-1]}, NOT ASSIGNED")
 
         # Print the assignment matrix
         print(f"\nAssignment Matrix (rows: orders, columns: lines):")
@@ -479,20 +956,16 @@ class PackingScheduleModelProblem3:
         # Rows
         for i in m.ORDERS:
             row = f"  Order {i:>2} |"
-            for j in m.LINES:
-                val = int(pyo.value(m.x[i, j]))
+            for val in x_mat[i-1]:
                 row += f"  {val}   |"
             print(row)
 
         # Show line utilization
         print(f"\nLine Utilization (u(j) variable):")
         for j in m.LINES:
-            u_val = int(pyo.value(m.u[j]))
+            u_val = solution['line_utilization'][j]
             status = "IN USE" if u_val == 1 else "NOT IN USE"
-            assigned_orders = []
-            for i in m.ORDERS:
-                if pyo.value(m.x[i, j]) > 0.5:
-                    assigned_orders.append(i)
+            assigned_orders = (np.flatnonzero(x_mat[:, j-1]) + 1).tolist()
 
             if assigned_orders:
                 print(f"  Line {j}: u({j})={u_val} ({status}) - {len(assigned_orders)} orders assigned -> {assigned_orders}")
@@ -504,10 +977,7 @@ class PackingScheduleModelProblem3:
         for u in m.TYPES:
             print(f"  Type {u}:")
             for j in m.LINES:
-                type_orders = []
-                for i in m.ORDERS:
-                    if m.order_type[i] == u and pyo.value(m.x[i, j]) > 0.5:
-                        type_orders.append(i)
+                type_orders = [i for i in m.orders_of_type[u] if x_mat[i-1, j-1]]
                 if type_orders:
                     print(f"    Line {j}: {len(type_orders)} orders -> {type_orders}")
 
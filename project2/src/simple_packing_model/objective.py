@@ -11,6 +11,7 @@ f = α * otif + β * wip_obj + γ * workforce + δ * total_not_utilized
 """
 
 import pyomo.environ as pyo
+from pyomo.core.expr.numeric_expr import LinearExpression
 
 
 class ObjectiveManager:
@@ -57,9 +58,13 @@ class ObjectiveManager:
         - Amount of lateness (continuous lateness(d) with weight 3)
         Each weighted by the demand's priority.
         """
-        return sum(
-            m.priority[d] * (7 * m.late[d] + 3 * m.lateness[d])
-            for d in m.DEMANDS
+        priority = [float(m.priority[d]) for d in m.DEMANDS]
+        return LinearExpression(
+            linear_coefs=[7 * p for p in priority] + [3 * p for p in priority],
+            linear_vars=(
+                [m.late[d] for d in m.DEMANDS] +
+                [m.lateness[d] for d in m.DEMANDS]
+            )
         )
 
     def _wip_term(self, m):
@@ -71,10 +76,10 @@ class ObjectiveManager:
 
         Summing inventory across all types and demands.
         """
-        return sum(
-            m.inv[u, d]
-            for u in m.TYPES
-            for d in m.DEMANDS
+        inv = list(m.inv.values())
+        return LinearExpression(
+            linear_coefs=[1.0] * len(inv),
+            linear_vars=inv
         )
 
     def _workforce_term(self, m):
@@ -85,9 +90,13 @@ class ObjectiveManager:
         workforce = workersrange
 
         This is the range of workforce utilization (max - min).
-        Lower range means more stable workforce utilization.
+        Lower range means more stable workforce utilization. It is written
+        as workersmax - workersmin directly, without a range variable.
         """
-        return m.workforcerange
+        return LinearExpression(
+            linear_coefs=[1.0, -1.0],
+            linear_vars=[m.workersmax, m.workersmin]
+        )
 
     def _not_utilized_term(self, m):
         """
@@ -99,7 +108,10 @@ class ObjectiveManager:
         This counts the number of production lines that are in use.
         Minimizing this encourages using fewer lines (consolidation).
         """
-        return sum(m.u[j] for j in m.LINES)
+        return LinearExpression(
+            linear_coefs=[1.0] * len(m.LINES),
+            linear_vars=[m.u[j] for j in m.LINES]
+        )
 
     def define_objective(self, model):
         """
@@ -113,15 +125,24 @@ class ObjectiveManager:
         2. WIP (beta): Total inventory across types and demands
         3. Workforce (gamma): Workforce range (max - min)
         4. Not utilized (delta): Number of lines in use (encourages line consolidation)
+
+        Each term is its own Expression component, so its value can be read
+        after solving (e.g. pyo.value(model.otif_term)) and the weighted sum
+        only refers to the four terms.
         """
 
+        model.otif_term = pyo.Expression(expr=self._otif_term(model), doc="OTIF term")
+        model.wip_term = pyo.Expression(expr=self._wip_term(model), doc="WIP term")
+        model.workforce_term = pyo.Expression(expr=self._workforce_term(model), doc="Workforce range term")
+        model.not_utilized_term = pyo.Expression(expr=self._not_utilized_term(model), doc="Lines in use term")
+
         def objective_rule(m):
             """Calculate the weighted sum of all objective terms."""
             return (
-                m.alpha * self._otif_term(m) +
-                m.beta * self._wip_term(m) +
-                m.gamma * self._workforce_term(m) +
-                m.delta * self._not_utilized_term(m)
+                m.alpha * m.otif_term +
+                m.beta * m.wip_term +
+                m.gamma * m.workforce_term +
+                m.delta * m.not_utilized_term
             )
 
         model.objective = pyo.Objective(
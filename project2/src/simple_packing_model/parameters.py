@@ -9,6 +9,41 @@ import pyomo.environ as pyo
 import numpy as np
 
 
+def _matrix_initializer(values):
+    """
+    Convert a 2-D array into a Param initializer keyed by 1-based indices.
+
+    The array is converted to nested Python floats in one call, so Param
+    construction is a dict insert per cell instead of a rule call.
+
+    Args:
+        values: Array-like of shape [rows, cols]
+
+    Returns:
+        dict mapping (r, c) to float, with r and c starting at 1
+    """
+    rows = np.asarray(values, dtype=float).tolist()
+    return {
+        (r, c): value
+        for r, row in enumerate(rows, start=1)
+        for c, value in enumerate(row, start=1)
+    }
+
+
+def _vector_initializer(values, dtype):
+    """
+    Convert a 1-D array into a Param initializer keyed by 1-based indices.
+
+    Args:
+        values: Array-like of shape [n]
+        dtype: int or float, the Python type of the Param values
+
+    Returns:
+        dict mapping i to a Python int/float, with i starting at 1
+    """
+    return dict(enumerate(np.asarray(values).astype(dtype).tolist(), start=1))
+
+
 def define_parameters(model, data):
     """
     Define sets and parameters for the Problem_3 packing schedule model.
@@ -33,12 +68,13 @@ def define_parameters(model, data):
         - priority: Array[n_orders] - priority(i)
     """
 
-    # Extract dimensions
-    n_unique_types = data['n_unique_types']
-    n_orders = data['n_orders']
-    n_demands = data['n_demands']
-    n_lines = data['n_lines']
-    T_max = data['T_max']
+    # Extract dimensions (as plain Python numbers, so numpy scalars from
+    # generated data don't end up in the RangeSet bounds)
+    n_unique_types = int(data['n_unique_types'])
+    n_orders = int(data['n_orders'])
+    n_demands = int(data['n_demands'])
+    n_lines = int(data['n_lines'])
+    T_max = float(data['T_max'])
 
     # Store dimensions
     model.n_unique_types = n_unique_types
@@ -50,6 +86,7 @@ def define_parameters(model, data):
     # ============================================
     # Sets
     # ============================================
+    # RangeSets are represented by their bounds only, not per-element objects.
 
     # u = 1, U: unique packing types
     model.TYPES = pyo.RangeSet(1, n_unique_types)
@@ -63,6 +100,42 @@ def define_parameters(model, data):
     # j = 1, J: line numbers
     model.LINES = pyo.RangeSet(1, n_lines)
 
+    # Order pairs (i, k) with i < k, for pairwise sequencing
+    model.ORDER_PAIRS = pyo.Set(
+        dimen=2,
+        initialize=[
+            (i, k)
+            for i in range(1, n_orders + 1)
+            for k in range(i + 1, n_orders + 1)
+        ],
+        doc="Order pairs (i, k) with i < k"
+    )
+
+    # Ordered demand pairs (d1, d) with d1 != d, for shipping order. A demand
+    # always counts as shipped by its own ship time, so the diagonal has no
+    # variable.
+    model.SHIP_PAIRS = pyo.Set(
+        dimen=2,
+        initialize=[
+            (d1, d)
+            for d1 in range(1, n_demands + 1)
+            for d in range(1, n_demands + 1)
+            if d1 != d
+        ],
+        doc="Demand pairs (d1, d) with d1 != d"
+    )
+
+    # Unordered demand pairs (d1, d) with d1 < d, one per pair of demands
+    model.DEMAND_PAIRS = pyo.Set(
+        dimen=2,
+        initialize=[
+            (d1, d)
+            for d1 in range(1, n_demands + 1)
+            for d in range(d1 + 1, n_demands + 1)
+        ],
+        doc="Demand pairs (d1, d) with d1 < d"
+    )
+
     # Events set: E = {s1, ..., sn, c1, ..., cn}
     # We'll use a combined set for event indices
     # Events are ordered: [start events for all orders, completion events for all orders]
@@ -76,15 +149,23 @@ def define_parameters(model, data):
     processing_time = data['processing_time']
     model.p = pyo.Param(
         model.TYPES, model.LINES,
-        initialize=lambda m, u, j: float(processing_time[u-1, j-1]),
+        initialize=_matrix_initializer(processing_time),
         doc="Processing time for item type u on line j"
     )
 
+    # Groups of lines with identical processing times for every type. Only
+    # p depends on the line, so lines within a group are interchangeable
+    # (see line_symmetry in constraints/assignment.py)
+    line_columns = {}
+    for j, column in enumerate(np.asarray(processing_time, dtype=float).T, start=1):
+        line_columns.setdefault(tuple(column.tolist()), []).append(j)
+    model.identical_lines = [group for group in line_columns.values() if len(group) > 1]
+
     # setup_time(u,v): Setup time for changing from item type u to item type v
     setup_time = data['setup_time']
     model.setup_time = pyo.Param(
         model.TYPES, model.TYPES,
-        initialize=lambda m, u, v: float(setup_time[u-1, v-1]),
+        initialize=_matrix_initializer(setup_time),
         doc="Setup time from type u to type v"
     )
 
@@ -96,7 +177,7 @@ def define_parameters(model, data):
     initial_inventory = data['initial_inventory']
     model.inv0 = pyo.Param(
         model.TYPES,
-        initialize=lambda m, u: int(initial_inventory[u-1]),
+        initialize=_vector_initializer(initial_inventory, int),
         doc="Initial inventory for packing unit type u"
     )
 
@@ -118,10 +199,18 @@ def define_parameters(model, data):
     order_type = data['order_type']
     model.order_type = pyo.Param(
         model.ORDERS,
-        initialize=lambda m, i: int(order_type[i-1]),
+        initialize=_vector_initializer(order_type, int),
         doc="Unit type of order i"
     )
 
+    # Orders of each type (inverse of type(i)), from a [types x orders] mask
+    type_ids = np.arange(1, n_unique_types + 1)
+    order_type_mask = np.asarray(order_type)[None, :] == type_ids[:, None]
+    model.orders_of_type = {
+        u: (np.flatnonzero(order_type_mask[u-1]) + 1).tolist()
+        for u in model.TYPES
+    }
+
     # ============================================
     # OTIF/Demand Parameters
     # ============================================
@@ -130,7 +219,7 @@ def define_parameters(model, data):
     due_date = data['due_date']
     model.due = pyo.Param(
         model.DEMANDS,
-        initialize=lambda m, d: float(due_date[d-1]),
+        initialize=_vector_initializer(due_date, float),
         doc="Due date for demand d"
     )
 
@@ -138,15 +227,25 @@ def define_parameters(model, data):
     demand_type = data['demand_type']
     model.prodtype = pyo.Param(
         model.DEMANDS,
-        initialize=lambda m, d: int(demand_type[d-1]),
+        initialize=_vector_initializer(demand_type, int),
         doc="Unit type for demand d"
     )
 
+    # Demands of each type
+    # Boolean [types x demands] mask, built with one numpy comparison. Rules
+    # that sum over the demands of type u iterate demands_of_type[u] instead
+    # of testing prodtype(d) == u for every demand.
+    demand_type_mask = np.asarray(demand_type)[None, :] == type_ids[:, None]
+    model.demands_of_type = {
+        u: (np.flatnonzero(demand_type_mask[u-1]) + 1).tolist()
+        for u in model.TYPES
+    }
+
     # qty(d): Quantity for demand d
     demand_qty = data['demand_qty']
     model.qty = pyo.Param(
         model.DEMANDS,
-        initialize=lambda m, d: int(demand_qty[d-1]),
+        initialize=_vector_initializer(demand_qty, int),
         doc="Quantity for demand d"
     )
 
@@ -154,7 +253,7 @@ def define_parameters(model, data):
     priority = data['priority']
     model.priority = pyo.Param(
         model.ORDERS,
-        initialize=lambda m, i: int(priority[i-1]),
+        initialize=_vector_initializer(priority, int),
         doc="Priority weight for order i"
     )
 
@@ -168,22 +267,57 @@ def define_parameters(model, data):
         doc="Small epsilon for strict inequalities"
     )
 
-    # Big-M for indicator constraints
+    # Big-M for indicator constraints between two times in [0, T_max]
+    # (ship, start, completion and event times): their difference never
+    # exceeds T_max. Rows enforcing a strict inequality use M + epsilon.
     model.M = pyo.Param(
-        initialize=10 * T_max,
+        initialize=T_max,
         doc="Big-M constant for indicator constraints"
     )
 
+    # M_pair(i,k): Big-M for the no-overlap constraint "k starts after i".
+    # When that constraint is relaxed it must allow any c(i) - s(k), i.e. up
+    # to T_max, plus the setup s(type(i), type(k)); that is the smallest
+    # valid value for the pair (a bare T_max cuts off schedules that use the
+    # whole horizon with a nonzero setup).
+    type_index = np.asarray(order_type, dtype=int) - 1
+    setup_matrix = np.asarray(setup_time, dtype=float)
+    M_pair = T_max + setup_matrix[type_index[:, None], type_index[None, :]]
+    model.M_pair = pyo.Param(
+        model.ORDERS, model.ORDERS,
+        initialize=_matrix_initializer(M_pair),
+        doc="Big-M for order k starting after order i on the same line"
+    )
+
+    # M_due(d): Big-M for terms bounded by T_max - due(d). Demand d ships in
+    # [due(d), T_max], so neither its lateness nor c(i) - ship(d) can exceed
+    # this value.
+    model.M_due = pyo.Param(
+        model.DEMANDS,
+        initialize=_vector_initializer(
+            np.maximum(0.0, T_max - np.asarray(due_date, dtype=float)), float
+        ),
+        doc="Big-M for lateness and completion after shipping of demand d"
+    )
+
+    # M_ship: Big-M for ship(d) + epsilon - c(i), at most T_max + epsilon
+    model.M_ship = pyo.Param(
+        initialize=T_max + pyo.value(model.epsilon),
+        doc="Big-M for an order completing after a demand ships"
+    )
+
     # Objective weights (if provided)
+    # Mutable, so set_objective_weights() can change them without rebuilding
+    # the objective expression
     obj_weights = data.get('objective_weights', {
         'alpha': 1.0,
         'beta': 1.0,
         'gamma': 1.0,
         'delta': 1.0
     })
-    model.alpha = pyo.Param(initialize=obj_weights.get('alpha', 1.0), doc="OTIF weight")
-    model.beta = pyo.Param(initialize=obj_weights.get('beta', 1.0), doc="WIP weight")
-    model.gamma = pyo.Param(initialize=obj_weights.get('gamma', 1.0), doc="Workforce weight")
-    model.delta = pyo.Param(initialize=obj_weights.get('delta', 1.0), doc="Not utilized weight")
+    model.alpha = pyo.Param(initialize=obj_weights.get('alpha', 1.0), mutable=True, doc="OTIF weight")
+    model.beta = pyo.Param(initialize=obj_weights.get('beta', 1.0), mutable=True, doc="WIP weight")
+    model.gamma = pyo.Param(initialize=obj_weights.get('gamma', 1.0), mutable=True, doc="Workforce weight")
+    model.delta = pyo.Param(initialize=obj_weights.get('delta', 1.0), mutable=True, doc="Not utilized weight")
 
     return model
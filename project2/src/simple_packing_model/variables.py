@@ -51,9 +51,9 @@ def define_variables(model):
     )
 
     # y(i,k): Binary variable for sequencing (order i before k)
-    # Used in line capacity constraints
+    # Used in line capacity constraints, which only need pairs i < k
     model.y = pyo.Var(
-        model.ORDERS, model.ORDERS,
+        model.ORDER_PAIRS,
         domain=pyo.Binary,
         doc="Order i is scheduled before order k on the same line"
     )
@@ -115,21 +115,16 @@ def define_variables(model):
         doc="Minimum workers used in any event"
     )
 
-    # workforcerange: Workforce range (max - min)
-    model.workforcerange = pyo.Var(
-        domain=pyo.NonNegativeReals,
-        bounds=(0, max_workers),
-        doc="Workforce range (max - min)"
-    )
-
     # ============================================
     # WIP Tracking Variables
     # ============================================
 
     # prodbefore(u,d): Number of units of product u produced and ready before demand d ships
+    # Continuous: it equals a sum of prodorder binaries, so it is integral
+    # without branching on it
     model.prodbefore = pyo.Var(
         model.TYPES, model.DEMANDS,
-        domain=pyo.NonNegativeIntegers,
+        domain=pyo.NonNegativeReals,
         doc="Units of product u produced before demand d ships"
     )
 
@@ -141,9 +136,11 @@ def define_variables(model):
     )
 
     # inv(u,d): Number of item type u in stock after fulfilling demand d
+    # Continuous: inventory_balance fixes it from integer data, prodbefore
+    # and shipped binaries
     model.inv = pyo.Var(
         model.TYPES, model.DEMANDS,
-        domain=pyo.NonNegativeIntegers,
+        domain=pyo.NonNegativeReals,
         doc="Inventory of type u after fulfilling demand d"
     )
 
@@ -156,8 +153,9 @@ def define_variables(model):
     )
 
     # shipped(d1,d): Demand d1 is shipped before or at the same time as demand d (binary)
+    # Only for d1 != d; shipped(d,d) is 1 by definition
     model.shipped = pyo.Var(
-        model.DEMANDS, model.DEMANDS,
+        model.SHIP_PAIRS,
         domain=pyo.Binary,
         doc="Demand d1 is shipped before or at the same time as demand d"
     )
@@ -0,0 +1,152 @@
+"""
+Heuristic Starting Solution for Problem_3
+
+A greedy inventory-first schedule whose values are handed to the solver as
+a MIP start (solve(warmstart=True)). The heuristic fixes the schedule
+decisions (line, start, completion and ship times); every other variable
+is derived from those times so the start is complete and feasible.
+"""
+
+import numpy as np
+
+
+def generate_initial_schedule(data, epsilon=0.0):
+    """
+    Build a greedy inventory-first schedule.
+
+    Demands are handled in due-date order. Each one is covered from stock
+    first; only the shortfall is produced, using the lowest-numbered unused
+    orders of the demand's type, each placed on the line where it finishes
+    earliest. A demand ships at its due date or when its production
+    completes, whichever is later.
+
+    Args:
+        data: Problem data dictionary
+        epsilon: Margin ship times must keep from T_max
+
+    Returns:
+        dict with arrays 'line' (1-based, 0 = unassigned), 'start',
+        'complete' (per order) and 'ship' (per demand), or None if the
+        schedule does not fit the horizon
+    """
+    n_orders = int(data['n_orders'])
+    n_lines = int(data['n_lines'])
+    T_max = float(data['T_max'])
+    order_type = np.asarray(data['order_type'])
+    processing_time = np.asarray(data['processing_time'], dtype=float)
+    setup_time = np.asarray(data['setup_time'], dtype=float)
+
+    # Unassigned orders sit at the end of the horizon with zero duration
+    line = np.zeros(n_orders, dtype=int)
+    start = np.full(n_orders, T_max)
+    complete = np.full(n_orders, T_max)
+
+    stock = np.asarray(data['initial_inventory'], dtype=float).copy()
+    line_free = np.zeros(n_lines)
+    line_last_type = np.zeros(n_lines, dtype=int)
+    last_start = {}
+    unused = {u: list(np.flatnonzero(order_type == u)) for u in set(order_type)}
+    ship = np.zeros(int(data['n_demands']))
+    last_ship = 0.0
+
+    for d in np.argsort(data['due_date'], kind='stable'):
+        u = int(data['demand_type'][d])
+        ready = 0.0
+        while stock[u-1] < data['demand_qty'][d]:
+            if not unused.get(u):
+                return None
+            i = unused[u].pop(0)
+            setup = np.array([
+                setup_time[line_last_type[j]-1, u-1] if line_last_type[j] else 0.0
+                for j in range(n_lines)
+            ])
+            begin = np.maximum(line_free + setup, last_start.get(u, 0.0))
+            finish = begin + processing_time[u-1]
+            j = int(np.argmin(finish))
+            line[i], start[i], complete[i] = j + 1, begin[j], finish[j]
+            line_free[j], line_last_type[j] = finish[j], u
+            last_start[u] = begin[j]
+            stock[u-1] += 1
+            ready = max(ready, finish[j])
+        stock[u-1] -= data['demand_qty'][d]
+        # Ship times are kept non-decreasing in processing order, so every
+        # demand shipped by ship[d] has already been netted against stock
+        ship[d] = last_ship = max(data['due_date'][d], ready, last_ship)
+
+    if ship.max() > T_max - epsilon:
+        return None
+
+    return {'line': line, 'start': start, 'complete': complete, 'ship': ship}
+
+
+def apply_initial_schedule(m, data, schedule):
+    """
+    Set every model variable from a schedule built by generate_initial_schedule().
+
+    Args:
+        m: Pyomo ConcreteModel built by PackingScheduleModelProblem3
+        data: Problem data dictionary
+        schedule: dict returned by generate_initial_schedule()
+    """
+    order_type = np.asarray(data['order_type'])
+    start = schedule['start']
+    complete = schedule['complete']
+    ship = schedule['ship']
+
+    # Relabel interchangeable lines so that, within each group of identical
+    # lines, the busier lines come first as line_symmetry requires
+    line = schedule['line'].copy()
+    for group in m.identical_lines:
+        counts = [(schedule['line'] == j).sum() for j in group]
+        ranked = [group[k] for k in np.argsort(counts, kind='stable')[::-1]]
+        for j_old, j_new in zip(ranked, group):
+            line[schedule['line'] == j_old] = j_new
+
+    assigned = line > 0
+    for i in m.ORDERS:
+        for j in m.LINES:
+            m.x[i, j].set_value(int(line[i-1] == j))
+        m.start[i].set_value(start[i-1])
+        m.complete[i].set_value(complete[i-1])
+    for (i, k) in m.ORDER_PAIRS:
+        m.y[i, k].set_value(int(start[i-1] <= start[k-1]))
+    for j in m.LINES:
+        m.u[j].set_value(int((line == j).any()))
+
+    # Events: starts first, then completions
+    t_event = np.concatenate([start, complete])
+    started = start[:, None] <= t_event[None, :]
+    notcomplete = complete[:, None] > t_event[None, :]
+    active = started & notcomplete
+    workers = active.sum(axis=0)
+    for e in m.EVENTS:
+        m.t_event[e].set_value(t_event[e-1])
+        m.workersused[e].set_value(int(workers[e-1]))
+        for i in m.ORDERS:
+            m.started[i, e].set_value(int(started[i-1, e-1]))
+            m.notcomplete[i, e].set_value(int(notcomplete[i-1, e-1]))
+            m.is_active[i, e].set_value(int(active[i-1, e-1]))
+    m.workersmax.set_value(int(workers.max()))
+    m.workersmin.set_value(int(workers.min()))
+
+    # Demands: production and shipments up to each shipping time
+    prodorder = assigned[:, None] & (complete[:, None] <= ship[None, :])
+    shipped = ship[:, None] <= ship[None, :]
+    for d in m.DEMANDS:
+        lateness = ship[d-1] - data['due_date'][d-1]
+        m.ship[d].set_value(ship[d-1])
+        m.lateness[d].set_value(lateness)
+        m.late[d].set_value(int(lateness > 0))
+        for i in m.ORDERS:
+            m.prodorder[i, d].set_value(int(prodorder[i-1, d-1]))
+        for d1 in m.DEMANDS:
+            if d1 != d:
+                m.shipped[d1, d].set_value(int(shipped[d1-1, d-1]))
+        for u in m.TYPES:
+            produced = int(prodorder[order_type == u, d-1].sum())
+            demanded = sum(
+                data['demand_qty'][d1-1] * shipped[d1-1, d-1]
+                for d1 in m.DEMANDS if data['demand_type'][d1-1] == u
+            )
+            m.prodbefore[u, d].set_value(produced)
+            m.inv[u, d].set_value(int(data['initial_inventory'][u-1] + produced - demanded))
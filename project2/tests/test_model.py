@@ -0,0 +1,236 @@
+"""
+Model tests for Project 2.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+import pyomo.environ as pyo
+
+# Add src and examples directories to path to import simple_packing_model
+# and the sample datasets
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+sys.path.insert(0, os.path.join(project_root, 'examples'))
+
+from simple_packing_model import PackingScheduleModelProblem3
+from simple_packing_model.warmstart import generate_initial_schedule, apply_initial_schedule
+from problem_3_example import create_sample_data
+from problem_3_inventory_example import create_inventory_test_data
+
+
+SAMPLE_DATA = {
+    'sample': create_sample_data,
+    'inventory': create_inventory_test_data,
+}
+
+
+def max_violation(m):
+    """Largest constraint, bound or integrality violation of the current values."""
+    worst = 0.0
+    for con in m.component_data_objects(pyo.Constraint, active=True):
+        body = pyo.value(con.body)
+        if con.has_lb():
+            worst = max(worst, pyo.value(con.lower) - body)
+        if con.has_ub():
+            worst = max(worst, body - pyo.value(con.upper))
+    for var in m.component_data_objects(pyo.Var):
+        if var.has_lb():
+            worst = max(worst, var.lb - var.value)
+        if var.has_ub():
+            worst = max(worst, var.value - var.ub)
+        if var.is_integer():
+            worst = max(worst, abs(var.value - round(var.value)))
+    return worst
+
+
+@pytest.mark.parametrize('name', sorted(SAMPLE_DATA))
+def test_initial_schedule_is_feasible(name):
+    """The heuristic schedule sets every variable and violates no constraint."""
+    data = SAMPLE_DATA[name]()
+    model = PackingScheduleModelProblem3(data)
+    schedule = generate_initial_schedule(data, pyo.value(model.model.epsilon))
+    assert schedule is not None
+
+    apply_initial_schedule(model.model, data, schedule)
+    assert max_violation(model.model) <= 1e-6
+
+
+def test_initial_schedule_none_for_short_horizon():
+    """No schedule is returned when the orders do not fit the horizon."""
+    data = create_sample_data()
+    data['T_max'] = 15.0
+    data['due_date'] = np.array([10.0, 12.0])
+    assert generate_initial_schedule(data) is None
+
+
+def test_set_start_from_model_rejects_other_dimensions():
+    """A start can only be reused between models of the same size."""
+    previous = PackingScheduleModelProblem3(create_sample_data())
+    model = PackingScheduleModelProblem3(create_inventory_test_data())
+    with pytest.raises(ValueError, match='n_demands'):
+        model.set_start_from_model(previous)
+
+
+def test_set_start_from_model_reaches_cold_optimum():
+    """Warm-starting from a solved scenario does not change the optimum."""
+    pytest.importorskip('highspy')
+    previous = PackingScheduleModelProblem3(create_sample_data())
+    previous.solve(tee=False)
+
+    data = create_sample_data()
+    data['due_date'] = np.array([25.0, 45.0])
+    cold = PackingScheduleModelProblem3(data).solve(tee=False)
+
+    model = PackingScheduleModelProblem3(data)
+    model.set_start_from_model(previous)
+    warm = model.solve(tee=False, warmstart=True)
+
+    assert warm['status'] == 'optimal'
+    assert warm['objective_value'] == pytest.approx(cold['objective_value'])
+
+
+@pytest.mark.parametrize('name', sorted(SAMPLE_DATA))
+def test_highspy_export_matches_appsi(name):
+    """The matrix from export_to_highspy() solves to the APPSI optimum."""
+    pytest.importorskip('highspy')
+    data = SAMPLE_DATA[name]()
+    appsi = PackingScheduleModelProblem3(data).solve('appsi_highs', tee=False)
+    direct = PackingScheduleModelProblem3(data).solve('highspy', tee=False)
+
+    assert direct['status'] == appsi['status'] == 'optimal'
+    assert direct['objective_value'] == pytest.approx(appsi['objective_value'])
+
+
+def test_sym_pairs_group_by_type_and_priority():
+    """Consecutive orders with equal type and priority are paired."""
+    model = PackingScheduleModelProblem3(create_sample_data())
+    assert sorted(model.model.SYM_PAIRS) == [(1, 2), (3, 4)]
+
+    # Order 2 differs in priority, so only orders 1 and 3 (type 1) and
+    # 4 and 5 (type 2) remain interchangeable
+    data = create_sample_data()
+    data['n_orders'] = 5
+    data['order_type'] = np.array([1, 1, 1, 2, 2])
+    data['priority'] = np.array([10, 5, 10, 10, 10])
+    model = PackingScheduleModelProblem3(data)
+    assert sorted(model.model.SYM_PAIRS) == [(1, 3), (4, 5)]
+
+
+@pytest.mark.parametrize('name', sorted(SAMPLE_DATA))
+def test_symmetry_breaking_keeps_optimum(name):
+    """Ordering interchangeable orders cuts off no objective value."""
+    pytest.importorskip('highspy')
+    data = SAMPLE_DATA[name]()
+    with_cuts = PackingScheduleModelProblem3(data).solve(tee=False)
+
+    model = PackingScheduleModelProblem3(data)
+    model.model.symmetry_breaking.deactivate()
+    without_cuts = model.solve(tee=False)
+
+    assert with_cuts['objective_value'] == pytest.approx(without_cuts['objective_value'])
+
+
+def create_identical_lines_data():
+    """The sample instance with a third line identical to line 2."""
+    data = create_sample_data()
+    data['n_lines'] = 3
+    data['processing_time'] = np.array([[10.0, 12.0, 12.0], [15.0, 13.0, 13.0]])
+    return data
+
+
+def test_line_symmetry_keeps_optimum():
+    """Filling identical lines in index order cuts off no objective value."""
+    pytest.importorskip('highspy')
+    data = create_identical_lines_data()
+    model = PackingScheduleModelProblem3(data)
+    assert model.model.identical_lines == [[2, 3]]
+    with_cuts = model.solve(tee=False)
+
+    model = PackingScheduleModelProblem3(data)
+    model.model.line_symmetry.deactivate()
+    model.model.line_use_symmetry.deactivate()
+    without_cuts = model.solve(tee=False)
+
+    assert with_cuts['objective_value'] == pytest.approx(without_cuts['objective_value'])
+
+
+def test_initial_schedule_respects_line_symmetry():
+    """The heuristic start is relabelled to satisfy the symmetry rows."""
+    data = create_identical_lines_data()
+    model = PackingScheduleModelProblem3(data)
+    schedule = generate_initial_schedule(data, pyo.value(model.model.epsilon))
+    # The greedy schedule loads line 3 more than line 2
+    assert (schedule['line'] == 3).sum() > (schedule['line'] == 2).sum()
+
+    apply_initial_schedule(model.model, data, schedule)
+    assert max_violation(model.model) <= 1e-6
+
+
+def test_appsi_solver_reused_while_settings_match():
+    """The HiGHS instance is kept across solves and rebuilt on new settings."""
+    pytest.importorskip('highspy')
+    data = create_inventory_test_data()
+    model = PackingScheduleModelProblem3(data)
+    first = model.solve(tee=False)
+    solver = model._solver
+    assert first['objective_value'] == pytest.approx(12.6)
+
+    # Mutable Param change: same instance, updated objective
+    model.set_objective_weights(gamma=10.0)
+    reused = model.solve(tee=False)
+    assert model._solver is solver
+
+    data['objective_weights'] = {**data['objective_weights'], 'gamma': 10.0}
+    fresh = PackingScheduleModelProblem3(data).solve(tee=False)
+    assert reused['objective_value'] == pytest.approx(fresh['objective_value'])
+    assert reused['objective_value'] == pytest.approx(22.1)
+
+    # New time limit or HiGHS options: rebuilt, since HiGHS keeps options
+    model.solve(tee=False, time_limit=60)
+    assert model._solver is not solver
+    solver = model._solver
+    model.solve(tee=False, time_limit=60, highs_options={'presolve': 'off'})
+    assert model._solver is not solver
+
+
+def test_set_objective_weights_updates_built_model():
+    """Only the given weights change, and the objective is not rebuilt."""
+    pytest.importorskip('highspy')
+    data = create_sample_data()
+    model = PackingScheduleModelProblem3(data)
+    model.solve(tee=False)
+    objective = model.model.objective
+
+    model.set_objective_weights(beta=3.0, delta=2.0)
+    m = model.model
+    assert [pyo.value(m.alpha), pyo.value(m.beta), pyo.value(m.gamma), pyo.value(m.delta)] == [
+        data['objective_weights']['alpha'], 3.0, data['objective_weights']['gamma'], 2.0
+    ]
+    assert m.objective is objective
+
+    reused = model.solve(tee=False, warmstart=True)
+    data['objective_weights'] = {**data['objective_weights'], 'beta': 3.0, 'delta': 2.0}
+    fresh = PackingScheduleModelProblem3(data).solve(tee=False)
+    assert reused['objective_value'] == pytest.approx(fresh['objective_value'])
+
+
+@pytest.mark.parametrize('name', sorted(SAMPLE_DATA))
+def test_apply_presolve_keeps_optimum(name):
+    """FBBT tightens bounds without changing the optimum."""
+    pytest.importorskip('highspy')
+    data = SAMPLE_DATA[name]()
+    plain = PackingScheduleModelProblem3(data).solve(tee=False)
+
+    model = PackingScheduleModelProblem3(data, apply_presolve=True)
+    m = model.model
+    for i in m.ORDERS:
+        assert m.started[i, i].fixed and m.started[i, i].value == 1
+        assert m.notcomplete[i, m.n_orders + i].fixed and m.notcomplete[i, m.n_orders + i].value == 0
+    for d in m.DEMANDS:
+        assert m.ship[d].lb == pytest.approx(data['due_date'][d - 1])
+
+    presolved = model.solve(tee=False)
+    assert presolved['objective_value'] == pytest.approx(plain['objective_value'])